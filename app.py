@@ -4,17 +4,25 @@ import math
 import pandas as pd
 import uuid
 import time
+import os
+from game_archive import GameRecorder
+from events import EVENT_MODEL
+from leaderboard import Leaderboard
+from orderbook import ContractBook, settle
+from projection import msy, project
+from app_rules import compute_price, resolve_auction, go_fishing, close_books, grow_fish
+from valuation import mark_to_market
 
-# --- 1. CONFIGURATION (MATCHING YOUR CLI CODE) ---
-MAX_FISH_CAPACITY = 2000
-BASE_FISH_PRICE = 5.0
-STARTING_CASH = 1000
-SHIP_COST = 300
-SHIP_SCRAP = 150
-STORAGE_COST = 1.0 
-BASELINE_DEMAND = 260
-CONTRACT_PRICE_MULT = 1.20
-CONTRACT_PENALTY_MULT = 2
+# --- 1. CONFIGURATION (SHARED WITH THE CLI VIA scenario.json) ---
+from scenario import (
+    SCENARIO, MAX_FISH_CAPACITY, SHORE_SHARE, INITIAL_STOCK, BASE_FISH_PRICE,
+    STARTING_CASH, STARTING_SHIPS, STORAGE_COST,
+    HARBOR_COST, SHORE_COST, DEEP_COST,
+    CONTRACT_QTY_RANGE, CONTRACT_PRICE_MULT, CONTRACT_PENALTY_MULT, CONTRACT_LIFETIME,
+)
+ARCHIVE_PATH = os.path.join("archives", "app.fta")
+LOTS_PER_PAGE = 20
+LOG_LIMIT = 200   # event log lines kept (newest first); older ones are dropped
 
 # --- 2. SERVER STATE ---
 @st.cache_resource
@@ -25,18 +33,27 @@ def get_game_state():
         'max_years': 5,
         
         # Ecology
-        'fish_shore': (MAX_FISH_CAPACITY * 0.4) * 0.4,
-        'fish_deep': (MAX_FISH_CAPACITY * 0.6) * 0.4,
+        'fish_shore': (MAX_FISH_CAPACITY * SHORE_SHARE) * INITIAL_STOCK,
+        'fish_deep': (MAX_FISH_CAPACITY * (1 - SHORE_SHARE)) * INITIAL_STOCK,
         'market_price': BASE_FISH_PRICE,
         
         # Event
-        'current_event': {"name": "Calm Seas", "desc": "Normal conditions.", "s_mod": 1.0, "d_mod": 1.0, "g_mod": 0.0},
+        'current_event': {"id": None, "name": "Calm Seas", "desc": "Normal conditions.", "s_mod": 1.0, "d_mod": 1.0, "g_mod": 0.0},
         
         # Players & Sync
         'players': {},
         'actions': {}, # Temporary storage for moves
+        'leaderboard': Leaderboard(), # Wealth ranking, updated as cash/ships change
         'auction_lots': [], # Stores items for sale
-        'logs': []
+        'last_fleet': (0, 0), # Total ships on (shore, deep) last season, for projections
+        'contract_book': ContractBook(), # Resting buyer contracts
+        'contract_offers': [], # Players' sell offers for this year, in submission order
+        'logs': [],
+
+        # Archive
+        'seed': None,
+        'recorder': None,
+        'archived': False
     }
 
 state = get_game_state()
@@ -48,30 +65,63 @@ my_id = st.session_state.user_id
 
 # --- 4. LOGIC FUNCTIONS (EXACTLY AS REQUESTED) ---
 def trigger_event():
-    # Weights: 40 for Calm, 12 for others
-    events = [
-        {"name": "Calm Seas", "desc": "Business as usual.", "s_mod": 1.0, "d_mod": 1.0, "g_mod": 0.0},
-        {"name": "Coastal Storm", "desc": "Shore efficiency -50%.", "s_mod": 0.5, "d_mod": 1.0, "g_mod": 0.0},
-        {"name": "Deep Freeze", "desc": "Deep efficiency -50%.", "s_mod": 1.0, "d_mod": 0.5, "g_mod": 0.0},
-        {"name": "Algae Bloom", "desc": "Reproduction -10%.", "s_mod": 1.0, "d_mod": 1.0, "g_mod": -0.10},
-        {"name": "Upwelling", "desc": "Reproduction +15%.", "s_mod": 1.0, "d_mod": 1.0, "g_mod": 0.15},
-    ]
-    # Simple random choice for web stability
-    state['current_event'] = random.choice(events)
-
-def compute_price(total_mass):
-    # Your specific exponential formula
-    k = 0.005
-    m = max(1, total_mass)
-    diff = BASELINE_DEMAND - m
-    multiplier = math.exp(k * diff)
-    price = BASE_FISH_PRICE * multiplier
-    return max(1.0, min(15.0, round(price, 2)))
+    # Same catalog and weights as the CLI (see events.py)
+    evt = EVENT_MODEL.sample(state['current_event'].get('id'))
+    state['current_event'] = {
+        "id": evt.id, "name": evt.name, "desc": evt.description,
+        "s_mod": evt.shore_mod, "d_mod": evt.deep_mod, "g_mod": evt.growth_mod,
+    }
+
+def post_contracts():
+    # Fresh buyer contracts each year; unfilled ones rest until they expire
+    book = state['contract_book']
+    book.expire(state['year'])
+    for _ in range(max(1, len(state['players']))):
+        qty = random.randint(*CONTRACT_QTY_RANGE)
+        price = round(state['market_price'] * CONTRACT_PRICE_MULT * random.uniform(0.9, 1.1), 2)
+        book.add_bid(qty, price, state['year'] + CONTRACT_LIFETIME - 1)
 
 def log(msg):
     state['logs'].insert(0, f"[Year {state['year']}] {msg}")
+    del state['logs'][LOG_LIMIT:]
+
+def refresh_ranks():
+    # Mark every captain to market at once (see valuation.py); the ship
+    # price moves with the stock, so one player's catch reprices everyone.
+    pids = list(state['players'])
+    ps = [state['players'][pid] for pid in pids]
+    values = mark_to_market([p['cash'] for p in ps], [p['ships'] for p in ps],
+                            state['fish_shore'] + state['fish_deep'], state['market_price'],
+                            [p['freezer'] for p in ps])
+    state['leaderboard'].rebuild(dict(zip(pids, values.tolist())))
+
+def seat(pid):
+    # Seat index of a player in the archive (join order)
+    return list(state['players'].keys()).index(pid)
+
+def start_recording():
+    state['seed'] = random.randrange(2**32)
+    random.seed(state['seed'])
+    state['recorder'] = GameRecorder("app", dict(SCENARIO, max_years=state['max_years']),
+                                     state['seed'], [p['name'] for p in state['players'].values()])
 
 # --- 5. UI COMPONENTS ---
+LOT_SORTS = {
+    "Lot #": lambda i, lot: i,
+    "Most ships": lambda i, lot: -lot['qty'],
+    "Lowest reserve": lambda i, lot: lot['min_price'],
+    "Lowest reserve / ship": lambda i, lot: lot['min_price'] / lot['qty'],
+}
+
+def my_bids():
+    # This session's draft bids as a sparse {lot index: amount}, reset for
+    # every auction: keyed by game (seed) and year, since a new game
+    # starts again at year 1
+    auction = (state['seed'], state['year'])
+    if st.session_state.get('bids_auction') != auction:
+        st.session_state.bids_auction = auction
+        st.session_state.my_bids = {}
+    return st.session_state.my_bids
 
 # SIDEBAR REFRESH BUTTON (CRITICAL FOR MULTIPLAYER)
 with st.sidebar:
@@ -87,6 +137,36 @@ with st.sidebar:
     st.metric("Shore Fish", int(state['fish_shore']))
     st.metric("Deep Fish", int(state['fish_deep']))
     st.info(f"Event: {state['current_event']['name']}")
+    if state['current_event']['id'] is not None:
+        outlook, chance = EVENT_MODEL.outlook(state['current_event']['id'])
+        st.caption(f"Next year's outlook: {outlook.name} ({int(chance * 100)}%)")
+
+    # Sustainability (analytical, cached by stock/fleet/event)
+    evt_id = state['current_event']['id'] or 0
+    best_s, best_d = msy("shore", evt_id), msy("deep", evt_id)
+    st.caption(f"Sustainable fleet (MSY) this weather: {best_s['ships']} shore / {best_d['ships']} deep ships")
+    fleet_s, fleet_d = state['last_fleet']
+    evt = state['current_event']
+    if state['phase'] == 'STORAGE':
+        # This season is fished but not grown yet: finish it, then forecast
+        ocean = {'fish_shore': state['fish_shore'], 'fish_deep': state['fish_deep'], 'current_event': evt}
+        grow_fish(ocean)
+        path = project(ocean['fish_shore'], ocean['fish_deep'], fleet_s, fleet_d, years=5, prev=evt['id'])
+    elif state['phase'] == 'GAMEOVER':
+        path = project(state['fish_shore'], state['fish_deep'], fleet_s, fleet_d, years=5, prev=evt['id'])
+    else:
+        path = project(state['fish_shore'], state['fish_deep'], fleet_s, fleet_d, years=5, current=evt['id'])
+    st.caption(f"5-year projection at last season's fleet ({fleet_s} shore / {fleet_d} deep): "
+               f"{int(path[-1][1] + path[-1][2])} fish")
+
+    board = state['leaderboard']
+    if len(board) > 0:
+        st.divider()
+        st.write("**🏆 Wealth Leaderboard**")
+        for i, (pid, w) in enumerate(board.top(5)):
+            st.write(f"{i+1}. {state['players'][pid]['name']} — ${int(w)}")
+        if my_id in board:
+            st.caption(f"Your rank: {board.rank(my_id)} of {len(board)}")
 
 # SAFETY CHECK
 if state['phase'] != 'LOBBY' and my_id not in state['players']:
@@ -106,9 +186,10 @@ if state['phase'] == 'LOBBY':
         name = st.text_input("Enter Captain Name")
         if st.button("Join Game"):
             state['players'][my_id] = {
-                'name': name, 'cash': STARTING_CASH, 'ships': 3, 
+                'name': name, 'cash': STARTING_CASH, 'ships': STARTING_SHIPS, 
                 'freezer': 0, 'last_catch': 0, 'last_profit': 0
             }
+            refresh_ranks()
             st.rerun()
     else:
         st.success(f"Signed in as {state['players'][my_id]['name']}")
@@ -120,7 +201,9 @@ if state['phase'] == 'LOBBY':
             st.write("---")
             state['max_years'] = st.number_input("Game Length (Years)", 1, 20, 5)
             if st.button("🚀 START GAME"):
+                start_recording()
                 trigger_event()
+                post_contracts()
                 state['phase'] = 'AUCTION_LIST'
                 st.rerun()
         else:
@@ -141,6 +224,7 @@ elif state['phase'] == 'AUCTION_LIST':
             state['auction_lots'] = []
             for pid, data in state['actions'].items():
                 if data['qty'] > 0:
+                    state['recorder'].action(state['year'], seat(pid), "list", data['qty'], data['min_price'])
                     state['auction_lots'].append({
                         'seller_id': pid,
                         'seller_name': state['players'][pid]['name'],
@@ -177,35 +261,20 @@ elif state['phase'] == 'AUCTION_BID':
         
         if len(state['actions']) == len(state['players']):
             # Resolve Auction
-            bids = state['actions'] # {pid: {lot_index: amount}}
+            bids = state['actions'] # {pid: {lot_index: amount}}, sparse
             
-            logs = []
-            for idx, lot in enumerate(state['auction_lots']):
-                highest_bid = 0
-                winner_id = None
-                
-                # Find highest bidder for this lot
-                for bidder_id, bid_map in bids.items():
-                    if bid_map == "skip": continue
-                    bid_val = bid_map.get(idx, 0)
-                    if bid_val >= lot['min_price'] and bid_val > highest_bid:
-                        # Prevent self-bidding exploits if desired, 
-                        # but standard logic allows buying back your own if you pay up
-                        if bidder_id != lot['seller_id']: 
-                            highest_bid = bid_val
-                            winner_id = bidder_id
-                
-                if winner_id:
-                    # Execute Trade
-                    state['players'][winner_id]['cash'] -= highest_bid
-                    state['players'][winner_id]['ships'] += lot['qty']
-                    
-                    state['players'][lot['seller_id']]['cash'] += highest_bid
-                    state['players'][lot['seller_id']]['ships'] -= lot['qty']
-                    
+            for bidder_id, bid_map in bids.items():
+                if bid_map == "skip": continue
+                for idx, bid_val in bid_map.items():
+                    if bid_val > 0:
+                        state['recorder'].action(state['year'], seat(bidder_id), "bid", idx, bid_val)
+
+            for lot, winner_id, highest_bid in resolve_auction(state['players'], state['auction_lots'], bids):
+                if winner_id is not None:
                     log(f"{state['players'][winner_id]['name']} bought {lot['qty']} ships from {lot['seller_name']} for ${highest_bid}")
                 else:
                     log(f"Lot from {lot['seller_name']} ({lot['qty']} ships) went unsold.")
+            refresh_ranks()
             
             state['actions'] = {}
             state['phase'] = 'FISHING'
@@ -220,19 +289,48 @@ elif state['phase'] == 'AUCTION_BID':
                 state['actions'][my_id] = "skip"
                 st.rerun()
         else:
-            bids_placed = {}
-            with st.form("bidding_form"):
-                for idx, lot in enumerate(state['auction_lots']):
-                    if lot['seller_id'] == my_id:
-                        st.caption(f"Lot #{idx+1}: Your listing ({lot['qty']} ships). Min: ${lot['min_price']}")
-                    else:
-                        st.markdown(f"**Lot #{idx+1}:** {lot['qty']} ships from {lot['seller_name']} (Min: ${lot['min_price']})")
-                        bids_placed[idx] = st.number_input(f"Your Bid for Lot #{idx+1}", 0, int(p['cash']), 0, key=f"bid_{idx}")
-                        st.divider()
-                
-                if st.form_submit_button("Submit Sealed Bids"):
-                    state['actions'][my_id] = bids_placed
-                    st.rerun()
+            # Only one page of lots is rendered; bids are entered per chosen lot
+            lots = state['auction_lots']
+            bids_placed = my_bids()
+
+            c1, c2 = st.columns([2, 1])
+            search = c1.text_input("Search seller", key="lot_search").strip().lower()
+            sort_by = c2.selectbox("Sort by", list(LOT_SORTS), key="lot_sort")
+            shown = [i for i, lot in enumerate(lots) if search in lot['seller_name'].lower()]
+            shown.sort(key=lambda i: LOT_SORTS[sort_by](i, lots[i]))
+
+            n_pages = max(1, math.ceil(len(shown) / LOTS_PER_PAGE))
+            if st.session_state.get('lot_page', 1) > n_pages:
+                st.session_state.lot_page = n_pages
+            page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, step=1, key="lot_page")
+            page_lots = shown[(page - 1) * LOTS_PER_PAGE:page * LOTS_PER_PAGE]
+
+            st.dataframe(pd.DataFrame([{
+                "Lot": f"#{i+1}",
+                "Seller": "You" if lots[i]['seller_id'] == my_id else lots[i]['seller_name'],
+                "Ships": lots[i]['qty'],
+                "Min": lots[i]['min_price'],
+                "Your Bid": bids_placed.get(i, 0),
+            } for i in page_lots], columns=["Lot", "Seller", "Ships", "Min", "Your Bid"]), hide_index=True)
+            st.caption(f"{len(shown)} of {len(lots)} lots match.")
+
+            biddable = [i for i in page_lots if lots[i]['seller_id'] != my_id]
+            if biddable:
+                with st.form("bid_entry"):
+                    idx = st.selectbox("Lot", biddable, format_func=lambda i: f"#{i+1}: {lots[i]['qty']} ships from {lots[i]['seller_name']} (Min: ${lots[i]['min_price']})")
+                    amount = st.number_input("Your sealed bid (0 removes it)", 0, max(0, int(p['cash'])), 0)
+                    if st.form_submit_button("Place Bid"):
+                        if amount > 0:
+                            bids_placed[idx] = amount
+                        else:
+                            bids_placed.pop(idx, None)
+                        st.rerun()
+
+            if bids_placed:
+                st.write("**Your bids:** " + ", ".join(f"Lot #{i+1}: ${b}" for i, b in sorted(bids_placed.items())))
+            if st.button("Submit Sealed Bids"):
+                state['actions'][my_id] = dict(bids_placed)
+                st.rerun()
 
 # PHASE: FISHING
 elif state['phase'] == 'FISHING':
@@ -244,39 +342,20 @@ elif state['phase'] == 'FISHING':
         if st.button("Refresh / Check Catch"): st.rerun()
         
         if len(state['actions']) == len(state['players']):
-            # CALC CATCH
+            # CALC CATCH (op costs are charged here)
+            total_caught_mass = go_fishing(state, state['actions'])
             total_s = sum(x['s'] for x in state['actions'].values())
             total_d = sum(x['d'] for x in state['actions'].values())
             
-            # Efficiency & Crowding
-            evt = state['current_event']
-            eff_s = 0.035 * evt['s_mod']
-            eff_d = 0.055 * evt['d_mod']
-            
-            # Penalty: 1 / (1 + (Excess * 0.05))
-            crowd_s = 1.0 / (1 + max(0, total_s - 10) * 0.05)
-            crowd_d = 1.0 / (1 + max(0, total_d - 10) * 0.05)
-            
-            pot_s = min(state['fish_shore'], state['fish_shore'] * eff_s * total_s * crowd_s)
-            pot_d = min(state['fish_deep'], state['fish_deep'] * eff_d * total_d * crowd_d)
-            
-            total_caught_mass = 0
-            
+            refresh_ranks()
             for pid, alloc in state['actions'].items():
-                s_share = (alloc['s'] / total_s * pot_s) if total_s > 0 else 0
-                d_share = (alloc['d'] / total_d * pot_d) if total_d > 0 else 0
-                
-                catch = s_share + d_share
-                state['players'][pid]['last_catch'] = catch
-                total_caught_mass += catch
-                
-                # Deduct Op Costs
-                cost = (alloc['s']*45) + (alloc['d']*60) + (alloc['h']*5)
-                state['players'][pid]['cash'] -= cost
+                state['recorder'].action(state['year'], seat(pid), "allocate", alloc['s'], alloc['d'])
+                state['recorder'].action(state['year'], seat(pid), "offer", alloc['offer_qty'], alloc['offer_min'])
             
-            # Ecology Update
-            state['fish_shore'] -= pot_s
-            state['fish_deep'] -= pot_d
+            state['last_fleet'] = (total_s, total_d)
+
+            # Contract offers are matched at STORAGE, in submission order
+            state['contract_offers'] = [(pid, a['offer_qty'], a['offer_min']) for pid, a in state['actions'].items()]
             
             # PRICE UPDATE (HAPPENS HERE, BEFORE FREEZING)
             state['market_price'] = compute_price(total_caught_mass)
@@ -288,14 +367,26 @@ elif state['phase'] == 'FISHING':
             
     else:
         st.write(f"Ships Available: **{p['ships']}**")
+
+        best = state['contract_book'].best_bids(5, state['year'])
+        if best:
+            st.write("**📜 Buyer Contracts** (best prices first)")
+            st.table(pd.DataFrame(best)[['qty', 'price', 'expires']].rename(
+                columns={'qty': 'Units Wanted', 'price': 'Price / Unit', 'expires': 'Open Until Year'}))
+
         with st.form("fish_form"):
-            s = st.number_input("Shore (Cost $45)", 0, p['ships'], 0)
-            d = st.number_input("Deep (Cost $60)", 0, p['ships']-s, 0)
+            s = st.number_input(f"Shore (Cost ${SHORE_COST})", 0, p['ships'], 0)
+            d = st.number_input(f"Deep (Cost ${DEEP_COST})", 0, p['ships']-s, 0)
             h = p['ships'] - s - d
-            st.caption(f"Harbor: {h} ships (Cost $5)")
+            st.caption(f"Harbor: {h} ships (Cost ${HARBOR_COST})")
+
+            st.write("**Contract Offer** (binding: undelivered units cost "
+                     f"{CONTRACT_PENALTY_MULT}x the contract price)")
+            offer_qty = st.number_input("Units offered to buyers", 0, 10000, 0)
+            offer_min = st.number_input("Minimum price per unit", 0.0, 100.0, float(state['market_price']))
             
             if st.form_submit_button("Launch Fleet"):
-                state['actions'][my_id] = {'s': s, 'd': d, 'h': h}
+                state['actions'][my_id] = {'s': s, 'd': d, 'h': h, 'offer_qty': offer_qty, 'offer_min': offer_min}
                 st.rerun()
 
 # PHASE: STORAGE (CRITICAL LOGIC UPDATE)
@@ -315,42 +406,48 @@ elif state['phase'] == 'STORAGE':
         if st.button("Refresh"): st.rerun()
         
         if len(state['actions']) == len(state['players']):
+            # Match contract offers and settle deliveries in one batch
+            # (contract fish comes out of the unfrozen pile)
+            to_sell_by = {
+                pid: state['players'][pid]['last_catch'] + state['players'][pid]['freezer'] - freeze_qty
+                for pid, freeze_qty in state['actions'].items()
+            }
+            fills = state['contract_book'].match(state['contract_offers'], state['year'])
+            settled = settle(fills, to_sell_by, CONTRACT_PENALTY_MULT)
+            state['contract_offers'] = []
+
             # Finalize Accounting
             for pid, freeze_qty in state['actions'].items():
                 p_obj = state['players'][pid]
+                deal = settled[pid]
                 
                 # Recalculate based on request
                 # Total available was (last_catch + old_freezer)
-                total_stock = p_obj['last_catch'] + p_obj['freezer']
-                
-                to_sell = total_stock - freeze_qty
-                
-                revenue = to_sell * state['market_price']
-                bill = freeze_qty * STORAGE_COST
-                
-                # Update Cash
-                p_obj['cash'] += revenue - bill
-                
-                # Update Freezer
-                p_obj['freezer'] = freeze_qty
-                
-                # Calculate Profit for leaderboard (Cash change)
-                # This is simplified; accurate profit tracking would need previous cash snapshot
-                # but for now, we just update the cash.
+                to_sell = to_sell_by[pid]
+                close_books(p_obj, freeze_qty, deal, state['market_price'])
+
+                if deal['filled'] > 0:
+                    msg = f"{p_obj['name']} was matched for {deal['filled']} contract units, delivered {int(deal['delivered'])}"
+                    if deal['penalty'] > 0:
+                        msg += f" (penalty ${deal['penalty']:.2f})"
+                    log(msg)
+
+                state['recorder'].action(state['year'], seat(pid), "freeze", freeze_qty, to_sell)
+                state['recorder'].year_result(state['year'], seat(pid), p_obj['ships'], p_obj['last_catch'],
+                                              freeze_qty, deal['filled'] > 0, p_obj['last_profit'], p_obj['cash'])
             
             # Growth
-            evt = state['current_event']
-            r_s = 0.28 + evt['g_mod']
-            r_d = 0.35 + evt['g_mod']
-            
-            # Logistic Growth
-            state['fish_shore'] += r_s * state['fish_shore'] * (1 - state['fish_shore']/(MAX_FISH_CAPACITY*0.4))
-            state['fish_deep'] += r_d * state['fish_deep'] * (1 - state['fish_deep']/(MAX_FISH_CAPACITY*0.6))
+            grow_fish(state)
+            refresh_ranks()
+            state['recorder'].ocean_state(state['year'], state['fish_shore'], state['fish_deep'],
+                                          state['market_price'], state['current_event']['name'])
             
             state['actions'] = {}
             state['year'] += 1
             state['phase'] = 'AUCTION_LIST' if state['year'] <= state['max_years'] else 'GAMEOVER'
-            if state['phase'] == 'AUCTION_LIST': trigger_event()
+            if state['phase'] == 'AUCTION_LIST':
+                trigger_event()
+                post_contracts()
             st.rerun()
             
     else:
@@ -358,6 +455,11 @@ elif state['phase'] == 'STORAGE':
         c1.metric("Fresh Catch", int(fresh))
         c2.metric("In Freezer", int(old_frozen))
         c3.metric("Total Stock", int(total_avail))
+
+        offer = next((o for o in state['contract_offers'] if o[0] == my_id), None)
+        if offer and offer[1] > 0:
+            st.warning(f"📜 You offered {offer[1]} units to buyers at ${offer[2]:.2f}+ per unit. "
+                       "Matched units are delivered from the fish you do NOT freeze.")
         
         with st.form("store_form"):
             st.write("How much to **FREEZE** for next year? (The rest is sold now)")
@@ -379,20 +481,25 @@ elif state['phase'] == 'GAMEOVER':
     st.balloons()
     st.title("🏆 Game Over")
     
-    # Calculate Wealth
-    ship_val = SHIP_SCRAP # Simplified for end game
+    # Standings come straight from the running leaderboard (already sorted)
     res = []
-    for pid, p in state['players'].items():
-        wealth = p['cash'] + (p['ships'] * ship_val)
+    for pid, total in state['leaderboard']:
+        p = state['players'][pid]
         res.append({
             "Captain": p['name'],
             "Cash": p['cash'],
             "Ships": p['ships'],
-            "Total Wealth": wealth
+            "Freezer": int(p['freezer']),
+            "Total Wealth": total
         })
     
-    df = pd.DataFrame(res).sort_values("Total Wealth", ascending=False)
+    df = pd.DataFrame(res)
     st.table(df)
+
+    # Archive the finished game once
+    if state['recorder'] and not state['archived']:
+        state['recorder'].save(ARCHIVE_PATH)
+        state['archived'] = True
     
     if st.button("Start New Game"):
         st.cache_resource.clear()
@@ -0,0 +1,107 @@
+import math
+
+from scenario import (
+    MAX_FISH_CAPACITY, SHORE_SHARE, SHORE_GROWTH, DEEP_GROWTH,
+    SHORE_EFFICIENCY, DEEP_EFFICIENCY, CROWDING_KNEE, CROWDING_SLOPE,
+    BASE_FISH_PRICE, BASELINE_DEMAND, PRICE_ELASTICITY, PRICE_FLOOR, PRICE_CEILING,
+    STORAGE_COST, HARBOR_COST, SHORE_COST, DEEP_COST,
+)
+
+# --- WEB GAME RULES ---
+# The economy of app.py as plain functions over its dict state, so it can
+# run headless (see fuzz.py). app.py keeps the UI, logging and recording.
+
+def compute_price(total_mass):
+    # Your specific exponential formula
+    k = PRICE_ELASTICITY
+    m = max(1, total_mass)
+    diff = BASELINE_DEMAND - m
+    multiplier = math.exp(k * diff)
+    price = BASE_FISH_PRICE * multiplier
+    return max(PRICE_FLOOR, min(PRICE_CEILING, round(price, 2)))
+
+def resolve_auction(players, lots, bids):
+    # bids: {pid: {lot_index: amount}} (sparse) or "skip". Returns
+    # [(lot, winner_id or None, price)] after executing the trades.
+    best = {}
+    for bidder_id, bid_map in bids.items():
+        if bid_map == "skip": continue
+        for idx, bid_val in bid_map.items():
+            lot = lots[idx]
+            # Prevent self-bidding exploits
+            if bid_val >= lot['min_price'] and bid_val > best.get(idx, (0, None))[0] and bidder_id != lot['seller_id']:
+                best[idx] = (bid_val, bidder_id)
+
+    results = []
+    for idx, lot in enumerate(lots):
+        highest_bid, winner_id = best.get(idx, (0, None))
+        if winner_id is not None:
+            # Execute Trade
+            players[winner_id]['cash'] -= highest_bid
+            players[winner_id]['ships'] += lot['qty']
+
+            players[lot['seller_id']]['cash'] += highest_bid
+            players[lot['seller_id']]['ships'] -= lot['qty']
+        results.append((lot, winner_id, highest_bid))
+    return results
+
+def go_fishing(state, actions):
+    # actions: {pid: {'s', 'd', 'h', ...}}. Sets last_catch, charges op
+    # costs, depletes the grounds; returns the total mass caught.
+    total_s = sum(x['s'] for x in actions.values())
+    total_d = sum(x['d'] for x in actions.values())
+
+    # Efficiency & Crowding
+    evt = state['current_event']
+    eff_s = SHORE_EFFICIENCY * evt['s_mod']
+    eff_d = DEEP_EFFICIENCY * evt['d_mod']
+
+    # Penalty: 1 / (1 + (Excess * slope))
+    crowd_s = 1.0 / (1 + max(0, total_s - CROWDING_KNEE) * CROWDING_SLOPE)
+    crowd_d = 1.0 / (1 + max(0, total_d - CROWDING_KNEE) * CROWDING_SLOPE)
+
+    pot_s = min(state['fish_shore'], state['fish_shore'] * eff_s * total_s * crowd_s)
+    pot_d = min(state['fish_deep'], state['fish_deep'] * eff_d * total_d * crowd_d)
+
+    total_caught_mass = 0
+
+    for pid, alloc in actions.items():
+        s_share = (alloc['s'] / total_s * pot_s) if total_s > 0 else 0
+        d_share = (alloc['d'] / total_d * pot_d) if total_d > 0 else 0
+
+        catch = s_share + d_share
+        state['players'][pid]['last_catch'] = catch
+        total_caught_mass += catch
+
+        # Deduct Op Costs
+        cost = (alloc['s']*SHORE_COST) + (alloc['d']*DEEP_COST) + (alloc['h']*HARBOR_COST)
+        state['players'][pid]['cash'] -= cost
+        state['players'][pid]['op_cost'] = cost
+
+    # Ecology Update
+    state['fish_shore'] -= pot_s
+    state['fish_deep'] -= pot_d
+    return total_caught_mass
+
+def close_books(p_obj, freeze_qty, deal, market_price):
+    # deal: this player's entry from orderbook.settle
+    revenue = deal['revenue'] + deal['remaining'] * market_price
+    bill = freeze_qty * STORAGE_COST
+
+    # Update Cash
+    p_obj['cash'] += revenue - bill - deal['penalty']
+
+    # Update Freezer
+    p_obj['freezer'] = freeze_qty
+
+    # Profit for the year (op costs were paid at FISHING)
+    p_obj['last_profit'] = revenue - bill - deal['penalty'] - p_obj.get('op_cost', 0)
+
+def grow_fish(state):
+    evt = state['current_event']
+    r_s = SHORE_GROWTH + evt['g_mod']
+    r_d = DEEP_GROWTH + evt['g_mod']
+
+    # Logistic Growth
+    state['fish_shore'] += r_s * state['fish_shore'] * (1 - state['fish_shore']/(MAX_FISH_CAPACITY*SHORE_SHARE))
+    state['fish_deep'] += r_d * state['fish_deep'] * (1 - state['fish_deep']/(MAX_FISH_CAPACITY*(1 - SHORE_SHARE)))
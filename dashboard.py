@@ -0,0 +1,177 @@
+from rich import box
+from rich.console import Console, Group
+from rich.layout import Layout
+from rich.live import Live
+from rich.panel import Panel
+from rich.text import Text
+
+_UNSET = object()
+
+
+class _FitScreen:
+    # Render the layout one line short of the terminal so the input line
+    # below it never scrolls the screen.
+    def __init__(self, layout):
+        self.layout = layout
+
+    def __rich_console__(self, console, options):
+        height = max(12, console.size.height - 1)
+        yield from self.layout.__rich_console__(console, options.update(height=height))
+
+
+# --- DASHBOARD ---
+# One persistent screen split into regions:
+#
+#   header                       phase / whose turn it is
+#   ecology | market | private   public state and the active player's books
+#   body                         phase content (lots, inventory, results)
+#   prompt                       last few messages + the current question
+#
+# Regions are updated with a data signature; a region is only rebuilt when
+# its signature changes and the screen is only redrawn when something did.
+# Low-bandwidth mode (remote terminals) drops Live, colour and unicode boxes
+# and prints just the regions that changed, as they change.
+class Dashboard:
+    REGIONS = ("header", "ecology", "market", "private", "body", "prompt")
+    LOG_LINES = 4
+
+    def __init__(self, console=None, low_bandwidth=False):
+        self.low_bandwidth = low_bandwidth
+        if console is None:
+            console = Console(color_system=None, emoji=False, highlight=False) if low_bandwidth else Console()
+        self.console = console
+        self.box = box.ASCII if low_bandwidth else box.ROUNDED
+        self.live = None
+        self._keys = {}
+        self._renderables = {}
+        self._dirty = []
+        self._log = []
+        self._question = ""
+
+        self.layout = Layout()
+        self.layout.split_column(
+            Layout(name="header", size=3),
+            Layout(name="top", size=12),
+            Layout(name="body", ratio=1),
+            Layout(name="prompt", size=self.LOG_LINES + 3),
+        )
+        self.layout["top"].split_row(Layout(name="ecology"), Layout(name="market"), Layout(name="private"))
+        for region in self.REGIONS:
+            self.layout[region].update(Text(""))
+
+    # --- lifecycle ---
+    def start(self):
+        if not self.low_bandwidth and self.live is None:
+            self.live = Live(_FitScreen(self.layout), console=self.console, screen=True, auto_refresh=False,
+                             redirect_stdout=False, redirect_stderr=False)
+            self.live.start()
+
+    def stop(self):
+        if self.live is not None:
+            self.live.stop()
+            self.live = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # --- regions ---
+    def update(self, region, key, build):
+        # `build` is a renderable or a callable producing one; it is only
+        # called when `key` differs from the region's last signature.
+        if self._keys.get(region, _UNSET) == key:
+            return
+        self._keys[region] = key
+        renderable = build() if callable(build) else build
+        self._renderables[region] = renderable
+        self.layout[region].update(renderable)
+        if region not in self._dirty:
+            self._dirty.append(region)
+
+    def clear(self, *regions):
+        for region in regions:
+            self.update(region, None, Text(""))
+
+    def header(self, text, style="bold white on blue"):
+        self.update("header", (text, style), lambda: Panel(Text.from_markup(text, justify="center"),
+                                                           style=style, box=self.box))
+
+    def body(self, key, build):
+        self.update("body", key, build)
+
+    def refresh(self):
+        if not self._dirty:
+            return
+        if self.live is not None:
+            self.live.refresh()
+        else:
+            for region in self.REGIONS:
+                if region in self._dirty and region != "prompt" and self._keys.get(region) is not None:
+                    self.console.print(self._renderables[region])
+        self._dirty = []
+
+    def handoff(self):
+        # Hot-seat privacy: wipe the previous player's books and messages.
+        # Low-bandwidth mode also clears the terminal, but public regions are
+        # only reprinted once their signature changes, as everywhere else.
+        self._log = []
+        self.clear("private", "body")
+        self._update_prompt()
+        if self.low_bandwidth:
+            self.console.clear()
+
+    # --- prompt area ---
+    def _update_prompt(self):
+        lines = tuple(self._log)
+        question = self._question
+        self.update("prompt", (lines, question), lambda: Panel(
+            Group(*[Text.from_markup(m) for m in lines], Text.from_markup(f"[bold]{question}[/bold]")),
+            title="Captain's Log", box=self.box,
+        ))
+
+    def say(self, message):
+        if self.live is None:
+            self.refresh()
+            self.console.print(message)
+            return
+        self._log = (self._log + [message])[-self.LOG_LINES:]
+        self._update_prompt()
+
+    def ask(self, question):
+        if self.live is None:
+            self.refresh()
+            return self.console.input(f"{question} ")
+        self._question = question
+        self._update_prompt()
+        self.refresh()
+        answer = input("> ")
+        self._question = ""
+        self._update_prompt()
+        return answer
+
+    def ask_int(self, question, min_val=0, max_val=99999, default=0):
+        while True:
+            raw = self.ask(f"{question} ({default})").strip()
+            try:
+                val = int(raw) if raw else default
+            except ValueError:
+                self.say("[red] -> Please enter a whole number.[/red]")
+                continue
+            if min_val <= val <= max_val:
+                return val
+            self.say(f"[red] -> Please enter a number between {min_val} and {max_val}.[/red]")
+
+    def confirm(self, question):
+        while True:
+            raw = self.ask(f"{question} [y/n]").strip().lower()
+            if raw in ("y", "yes"):
+                return True
+            if raw in ("n", "no"):
+                return False
+            self.say("[red] -> Please enter y or n.[/red]")
+
+    def pause(self, text="Press Enter to continue..."):
+        self.ask(f"[italic]{text}[/italic]")
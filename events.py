@@ -0,0 +1,107 @@
+import random
+
+import numpy as np
+
+from scenario import EVENT_CATALOG
+
+
+# --- EVENTS ---
+class Event:
+    def __init__(self, name, description, shore_mod=1.0, deep_mod=1.0, growth_mod=0.0, id=0):
+        self.id = id
+        self.name = name
+        self.description = description
+        self.shore_mod = shore_mod
+        self.deep_mod = deep_mod
+        self.growth_mod = growth_mod
+
+
+# --- ALIAS TABLES ---
+# Vose's alias method: one uniform column pick plus one coin flip per draw,
+# whatever the number of events.
+def build_alias(probs):
+    probs = np.asarray(probs, dtype=float)
+    k = len(probs)
+    scaled = probs / probs.sum() * k
+    prob = np.ones(k)
+    alias = np.arange(k)
+    small = [i for i in range(k) if scaled[i] < 1.0]
+    large = [i for i in range(k) if scaled[i] >= 1.0]
+    while small and large:
+        s, l = small.pop(), large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] -= 1.0 - scaled[s]
+        (small if scaled[l] < 1.0 else large).append(l)
+    return prob, alias
+
+
+# --- WEATHER MODEL ---
+# Markov chain over the catalog. Row i of the transition matrix mixes the base
+# weights with a "same again" bump of event i's persistence, so storms can
+# cluster while persistence 0 gives the classic independent yearly draw. The
+# extra last row (index K) is the start state with no weather history.
+class EventModel:
+    def __init__(self, catalog):
+        self.events = [
+            Event(e["name"], e["description"], e["shore_mod"], e["deep_mod"], e["growth_mod"], id=i)
+            for i, e in enumerate(catalog)
+        ]
+        k = len(self.events)
+        weights = np.array([e["weight"] for e in catalog], dtype=float)
+        weights /= weights.sum()
+        persistence = np.array([e.get("persistence", 0.0) for e in catalog])
+
+        self.transition = np.vstack([
+            (1 - persistence)[:, None] * weights[None, :] + np.diag(persistence),
+            weights,
+        ])
+        tables = [build_alias(row) for row in self.transition]
+        self.prob = np.array([t[0] for t in tables])
+        self.alias = np.array([t[1] for t in tables])
+        self._prob_rows = self.prob.tolist()
+        self._alias_rows = self.alias.tolist()
+
+        self.shore_mod = np.array([e.shore_mod for e in self.events])
+        self.deep_mod = np.array([e.deep_mod for e in self.events])
+        self.growth_mod = np.array([e.growth_mod for e in self.events])
+        self.names = tuple(e.name for e in self.events)
+
+    def _row(self, prev):
+        return len(self.events) if prev is None else prev
+
+    def sample(self, prev=None, rng=random):
+        # Single draw for the frontends; uses the `random` module by default
+        # so a seeded game replays the same weather.
+        row = self._row(prev)
+        col = int(rng.random() * len(self.events))
+        if rng.random() < self._prob_rows[row][col]:
+            return self.events[col]
+        return self.events[self._alias_rows[row][col]]
+
+    def sample_batch(self, prev, rng):
+        # prev: (N,) event ids, -1 for "no history". Returns (N,) ids.
+        prev = np.asarray(prev)
+        row = np.where(prev < 0, len(self.events), prev)
+        col = rng.integers(0, len(self.events), size=prev.shape)
+        keep = rng.random(prev.shape) < self.prob[row, col]
+        return np.where(keep, col, self.alias[row, col])
+
+    def forecast(self, prev=None, years=3):
+        # (years, K) probabilities of each event 1..years ahead
+        dist = self.transition[self._row(prev)]
+        square = self.transition[:-1]
+        out = [dist]
+        for _ in range(years - 1):
+            dist = dist @ square
+            out.append(dist)
+        return np.array(out)
+
+    def outlook(self, prev=None):
+        probs = self.forecast(prev, 1)[0]
+        best = int(probs.argmax())
+        return self.events[best], float(probs[best])
+
+
+EVENT_MODEL = EventModel(EVENT_CATALOG)
+EVENTS = EVENT_MODEL.events
@@ -0,0 +1,263 @@
+import argparse
+import json
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import app_rules
+import local4p
+from events import EVENTS
+from orderbook import settle
+from scenario import MAX_FISH_CAPACITY, SHORE_SHARE, STARTING_CASH, STARTING_SHIPS, CONTRACT_PENALTY_MULT
+
+REL_TOL = 1e-6
+
+# --- DIFFERENTIAL FUZZER ---
+# Generates random games (starting state + per-year actions), plays each year
+# through both rule sets headless -- local4p's Ocean/Player functions and
+# app.py's dict rules (app_rules.py) -- and compares the shared state after
+# every phase. The first mismatch is shrunk to a minimal case.
+#
+# Contracts and ship orders are left out: the two frontends run different
+# contract markets and only local4p has a shipyard. Known divergences are
+# off by default so the fuzzer keeps finding new ones:
+#   --self-bids   let sellers bid on their own lots (app.py refuses those)
+#   --overstock   start stocks above capacity (app.py doesn't clamp growth at 0)
+# and --ignore FIELD silences a field (e.g. "cash") once a finding is known.
+
+def random_case(rng, players=None, years=None, self_bids=False, overstock=False):
+    # Plain rng.random() arithmetic throughout: randint/choice dominate the
+    # profile otherwise.
+    r = rng.random
+    n = players or 1 + int(r() * 6)
+    stock_max = 6.0 if overstock else 1.0
+    case = {
+        "shore": r() * stock_max * MAX_FISH_CAPACITY * SHORE_SHARE,
+        "deep": r() * stock_max * MAX_FISH_CAPACITY * (1 - SHORE_SHARE),
+        "cash": [STARTING_CASH if r() < 0.5 else -500 + r() * 5500 for _ in range(n)],
+        "ships": [STARTING_SHIPS if r() < 0.5 else int(r() * 16) for _ in range(n)],
+        "years": [],
+    }
+    for _ in range(years or 1 + int(r() * 10)):
+        case["years"].append({
+            "event": int(r() * len(EVENTS)),
+            "list": [(1 + int(r() * 5) if r() < 0.33 else 0, int(r() * 1500)) for _ in range(n)],
+            "bids": [{str(int(r() * n)): int(r() * 2000) for _ in range(int(r() * 3))} for _ in range(n)],
+            "alloc": [(r(), r()) for _ in range(n)],
+            "freeze": [r() if r() < 0.5 else 0.0 for _ in range(n)],
+        })
+    case["self_bids"] = self_bids
+    return case
+
+
+class Mismatch(Exception):
+    def __init__(self, year, phase, field, cli, web):
+        super().__init__(f"year {year} {phase}: {field} local4p={cli!r} app={web!r}")
+        self.year, self.phase, self.field, self.cli, self.web = year, phase, field, cli, web
+
+    def __reduce__(self):
+        return Mismatch, (self.year, self.phase, self.field, self.cli, self.web)
+
+    @property
+    def kind(self):
+        return self.phase, self.field.split(".")[-1]
+
+
+def _close(a, b):
+    return a == b or abs(a - b) <= REL_TOL * max(1.0, abs(a), abs(b))
+
+
+def run_case(case, ignore=()):
+    # Returns the number of years played; raises Mismatch on divergence
+    n = len(case["cash"])
+    ocean = local4p.Ocean()
+    ocean.fish_shore, ocean.fish_deep = case["shore"], case["deep"]
+    ocean.current_total_fish = ocean.fish_shore + ocean.fish_deep
+    cli = [local4p.Player(f"P{i}") for i in range(n)]
+    state = {"fish_shore": case["shore"], "fish_deep": case["deep"], "players": {}}
+    for i, p in enumerate(cli):
+        p.cash, p.ships = float(case["cash"][i]), case["ships"][i]
+        state["players"][i] = {"name": p.name, "cash": p.cash, "ships": p.ships, "freezer": 0, "last_catch": 0, "last_profit": 0}
+    web = state["players"]
+
+    def check(year, phase, fields):
+        for field, a, b in fields:
+            if not _close(a, b) and field not in ignore:
+                raise Mismatch(year, phase, field, a, b)
+
+    def check_players(year, phase, keys):
+        for k in keys:
+            if k in ignore:
+                continue
+            for i, p in enumerate(cli):
+                a, b = getattr(p, k), web[i][k]
+                if not _close(a, b):
+                    raise Mismatch(year, phase, f"p{i}.{k}", a, b)
+
+    for year, acts in enumerate(case["years"], 1):
+        e = EVENTS[acts["event"]]
+        ocean.current_event = e
+        state["current_event"] = {"s_mod": e.shore_mod, "d_mod": e.deep_mod, "g_mod": e.growth_mod}
+
+        # Auction: same listings and bids on both sides, in seat order
+        listings, lots = [], []
+        for i, (qty, min_p) in enumerate(acts["list"]):
+            qty = min(qty, cli[i].ships)
+            if qty > 0:
+                listings.append({'seller': cli[i], 'qty': qty, 'min': min_p})
+                lots.append({'seller_id': i, 'seller_name': cli[i].name, 'qty': qty, 'min_price': min_p})
+        all_bids = {j: {} for j in range(len(listings))}
+        web_bids = {}
+        for i, bid_map in enumerate(acts["bids"]):
+            max_bid = max(0, int(cli[i].cash))
+            web_bids[i] = {}
+            for lot, bid in bid_map.items():
+                j = int(lot)
+                if j >= len(listings) or (lots[j]['seller_id'] == i and not case["self_bids"]):
+                    continue
+                all_bids[j][cli[i]] = web_bids[i][j] = min(bid, max_bid)
+        local4p.resolve_auction(listings, all_bids)
+        app_rules.resolve_auction(web, lots, web_bids)
+        check_players(year, "auction", ("cash", "ships"))
+
+        # Fishing
+        actions = {}
+        for i, (fs, fd) in enumerate(acts["alloc"]):
+            s = int(fs * (cli[i].ships + 1)) if cli[i].ships > 0 else 0
+            s = min(s, cli[i].ships)
+            d = min(int(fd * (cli[i].ships - s + 1)), cli[i].ships - s)
+            cli[i].set_allocation(s, d)
+            cli[i].accepted_contract = False
+            actions[i] = {'s': s, 'd': d, 'h': cli[i].ships - s - d}
+        catches, cli_mass = ocean.calculate_catch(cli)
+        web_mass = app_rules.go_fishing(state, actions)
+        cli_price, web_price = local4p.compute_price(cli_mass), app_rules.compute_price(web_mass)
+        for p in cli:
+            p.last_catch = catches[p]['shore'] + catches[p]['deep']
+        check_players(year, "fishing", ("last_catch",))
+        check(year, "fishing", [("fish_shore", ocean.fish_shore, state["fish_shore"]),
+                                ("fish_deep", ocean.fish_deep, state["fish_deep"]),
+                                ("price", cli_price, web_price)])
+
+        # Storage & accounting (no contracts: every unfrozen fish is sold)
+        to_sell_by = {}
+        for i, p in enumerate(cli):
+            available = int(p.last_catch + p.freezer)
+            freeze = int(acts["freeze"][i] * available)
+            local4p.settle_accounts(p, freeze, available - freeze, 0, 0, cli_price)
+            to_sell_by[i] = web[i]['last_catch'] + web[i]['freezer'] - freeze
+        deals = settle([], to_sell_by, CONTRACT_PENALTY_MULT)
+        for i, p in enumerate(cli):
+            app_rules.close_books(web[i], p.freezer, deals[i], web_price)
+        check_players(year, "accounting", ("cash", "freezer", "last_profit"))
+
+        ocean.reproduce_fish()
+        app_rules.grow_fish(state)
+        check(year, "growth", [("fish_shore", ocean.fish_shore, state["fish_shore"]),
+                               ("fish_deep", ocean.fish_deep, state["fish_deep"])])
+    return len(case["years"])
+
+
+# --- SHRINKING ---
+def _fails_like(case, kind, ignore):
+    try:
+        run_case(case, ignore)
+    except Mismatch as m:
+        return m.kind == kind
+    return False
+
+
+def _drop_player(case, i):
+    out = dict(case, cash=case["cash"][:i] + case["cash"][i + 1:], ships=case["ships"][:i] + case["ships"][i + 1:])
+    out["years"] = [dict(y, **{k: y[k][:i] + y[k][i + 1:] for k in ("list", "bids", "alloc", "freeze")})
+                    for y in case["years"]]
+    return out
+
+
+def shrink(case, mismatch, ignore=()):
+    # Greedy: fewer years, fewer players, then neutral actions, as long as
+    # the same kind of mismatch (phase, field) still shows up.
+    kind = mismatch.kind
+    case = dict(case, years=case["years"][:mismatch.year])
+    changed = True
+    while changed:
+        changed = False
+        for y in range(len(case["years"])):
+            trial = dict(case, years=case["years"][:y] + case["years"][y + 1:])
+            if trial["years"] and _fails_like(trial, kind, ignore):
+                case, changed = trial, True
+                break
+        for i in range(len(case["cash"])):
+            trial = _drop_player(case, i)
+            if trial["cash"] and _fails_like(trial, kind, ignore):
+                case, changed = trial, True
+                break
+        neutral = {"list": (0, 0), "bids": {}, "alloc": (0.0, 0.0), "freeze": 0.0}
+        for y, acts in enumerate(case["years"]):
+            for key, value in neutral.items():
+                for i in range(len(acts[key])):
+                    if acts[key][i] == value:
+                        continue
+                    years = [dict(a) for a in case["years"]]
+                    years[y][key] = list(acts[key])
+                    years[y][key][i] = value
+                    trial = dict(case, years=years)
+                    if _fails_like(trial, kind, ignore):
+                        case, acts, changed = trial, years[y], True
+    return case
+
+
+# --- DRIVER ---
+def fuzz_batch(seeds, ignore=(), self_bids=False, overstock=False):
+    # Worker: plays one case per seed; returns (years played, first failure)
+    steps = 0
+    for seed in seeds:
+        case = random_case(random.Random(seed), self_bids=self_bids, overstock=overstock)
+        try:
+            steps += run_case(case, ignore)
+        except Mismatch as m:
+            return steps + m.year, (seed, case, m)
+    return steps, None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Differential fuzzer: local4p.py rules vs app.py rules")
+    parser.add_argument("--cases", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--batch", type=int, default=2000, help="cases per worker task")
+    parser.add_argument("--self-bids", action="store_true")
+    parser.add_argument("--overstock", action="store_true")
+    parser.add_argument("--ignore", action="append", default=[], help="field to skip (cash, price, ...)")
+    args = parser.parse_args()
+
+    ignore = tuple(args.ignore)
+    starts = range(args.seed, args.seed + args.cases, args.batch)
+    start = time.perf_counter()
+    steps, failure = 0, None
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(fuzz_batch, range(s, min(s + args.batch, args.seed + args.cases)),
+                               ignore, args.self_bids, args.overstock) for s in starts]
+        for f in futures:
+            n, found = f.result()
+            steps += n
+            if found and (failure is None or found[0] < failure[0]):
+                failure = found
+    elapsed = time.perf_counter() - start
+    print(f"{steps} game-years in {elapsed:.1f}s ({steps / elapsed * 60:,.0f} / minute)")
+
+    if failure is None:
+        print("No divergence found.")
+        return
+    seed, case, mismatch = failure
+    print(f"Divergence (case seed {seed}): {mismatch}")
+    small = shrink(case, mismatch, ignore)
+    try:
+        run_case(small, ignore)
+    except Mismatch as m:
+        print(f"Minimal case: {m}")
+    print(json.dumps(small, indent=1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import glob
+import os
+import time
+
+import msgpack
+import numpy as np
+import pandas as pd
+
+# --- FORMAT ---
+# An archive file is a stream of msgpack maps, one per finished game, so games
+# can be appended to the same file. Bulk data (action log, yearly results,
+# ocean history) is stored column-wise as raw little-endian buffers that load
+# straight into NumPy without building a Python object per value.
+ARCHIVE_FORMAT = "fish-tycoon-archive"
+ARCHIVE_VERSION = 1
+
+# kind codes are positions in this tuple: append only, so old archives
+# keep decoding. "contract" is (accepted, qty) for the hot-seat/netplay
+# single contract; "offer" is (qty, min price) for a web order-book offer.
+ACTION_KINDS = ("list", "bid", "contract", "order", "allocate", "freeze", "offer")
+
+ACTION_COLUMNS = {"year": "<i4", "player": "<i4", "kind": "<u1", "a": "<f8", "b": "<f8"}
+RESULT_COLUMNS = {
+    "year": "<i4", "player": "<i4", "ships": "<i4", "catch": "<f8", "frozen": "<f8",
+    "contract": "<u1", "profit": "<f8", "cash": "<f8",
+}
+OCEAN_COLUMNS = {"year": "<i4", "shore": "<f8", "deep": "<f8", "price": "<f8", "event": "<u1"}
+
+
+def _pack_columns(rows, columns):
+    packed = {}
+    for i, (name, dtype) in enumerate(columns.items()):
+        arr = np.asarray([r[i] for r in rows], dtype=dtype)
+        packed[name] = {"dtype": dtype, "data": arr.tobytes()}
+    return packed
+
+
+def _unpack_columns(packed):
+    return {name: np.frombuffer(col["data"], dtype=col["dtype"]) for name, col in packed.items()}
+
+
+# --- RECORDING ---
+class GameRecorder:
+    def __init__(self, frontend, config, seed, players, events=()):
+        self.frontend = frontend
+        self.config = dict(config)
+        self.seed = seed
+        self.players = list(players)
+        self.events = list(events)
+        self.actions = []
+        self.results = []
+        self.ocean = []
+
+    # `player` is always the seat index into self.players
+    def action(self, year, player, kind, a=0, b=0):
+        self.actions.append((year, player, ACTION_KINDS.index(kind), a, b))
+
+    def year_result(self, year, player, ships, catch, frozen, contract, profit, cash):
+        self.results.append((year, player, ships, catch, frozen, int(bool(contract)), profit, cash))
+
+    def ocean_state(self, year, shore, deep, price, event=""):
+        if event not in self.events:
+            self.events.append(event)
+        self.ocean.append((year, shore, deep, price, self.events.index(event)))
+
+    def to_record(self):
+        return {
+            "format": ARCHIVE_FORMAT,
+            "version": ARCHIVE_VERSION,
+            "frontend": self.frontend,
+            "created": time.time(),
+            "seed": self.seed,
+            "config": self.config,
+            "players": self.players,
+            "events": self.events,
+            "actions": _pack_columns(self.actions, ACTION_COLUMNS),
+            "results": _pack_columns(self.results, RESULT_COLUMNS),
+            "ocean": _pack_columns(self.ocean, OCEAN_COLUMNS),
+        }
+
+    def save(self, path, append=True):
+        write_game(path, self.to_record(), append=append)
+
+
+def write_game(path, record, append=True):
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, "ab" if append else "wb") as f:
+        f.write(msgpack.packb(record, use_bin_type=True))
+
+
+# --- LOADING ---
+def iter_games(path):
+    with open(path, "rb") as f:
+        for record in msgpack.Unpacker(f, raw=False):
+            if record.get("format") != ARCHIVE_FORMAT:
+                raise ValueError(f"{path}: not a Fish Tycoon archive")
+            if record.get("version", 0) > ARCHIVE_VERSION:
+                raise ValueError(f"{path}: archive version {record['version']} is newer than {ARCHIVE_VERSION}")
+            for key in ("actions", "results", "ocean"):
+                record[key] = _unpack_columns(record[key])
+            yield record
+
+
+def _expand_paths(paths):
+    if isinstance(paths, str):
+        paths = [paths]
+    out = []
+    for p in paths:
+        if os.path.isdir(p):
+            out.extend(sorted(glob.glob(os.path.join(p, "*.fta"))))
+        else:
+            out.extend(sorted(glob.glob(p)) or [p])
+    return out
+
+
+def load_archives(paths, tables=("results", "ocean", "actions")):
+    # Streams every game in `paths` (files, directories or globs) and returns
+    # one DataFrame per table, tagged with a game_id. Columns are concatenated
+    # as arrays, so only one game's record is ever held as Python objects.
+    chunks = {t: {} for t in tables}
+    games = []
+    game_id = 0
+    for path in _expand_paths(paths):
+        for record in iter_games(path):
+            games.append({
+                "game_id": game_id, "file": path, "frontend": record["frontend"],
+                "created": record["created"], "seed": record["seed"],
+                "n_players": len(record["players"]), **record["config"],
+            })
+            if record["events"]:
+                names = np.asarray(record["events"], dtype=object)
+                record["ocean"]["event"] = names[record["ocean"]["event"]]
+            for t in tables:
+                cols = record[t]
+                n = len(next(iter(cols.values()))) if cols else 0
+                chunks[t].setdefault("game_id", []).append(np.full(n, game_id, dtype="<i4"))
+                for name, arr in cols.items():
+                    chunks[t].setdefault(name, []).append(arr)
+            game_id += 1
+
+    frames = {"games": pd.DataFrame(games)}
+    for t in tables:
+        frames[t] = pd.DataFrame({name: np.concatenate(parts) for name, parts in chunks[t].items()})
+    if "actions" in frames and len(frames["actions"]):
+        frames["actions"]["kind"] = pd.Categorical.from_codes(frames["actions"]["kind"], ACTION_KINDS)
+    return frames
@@ -0,0 +1,63 @@
+import bisect
+import itertools
+
+
+# --- LEADERBOARD ---
+# Keeps players ordered by score as scores change, instead of re-sorting the
+# whole field on every render. Entries are (-score, seat, key) in a sorted
+# list: an update is two bisects plus one memmove, top(k) is a slice and
+# rank() is a single bisect. Ties keep first-seen order. Keys only need to be
+# hashable (player ids, Player objects, (table, player) pairs...).
+class Leaderboard:
+    def __init__(self, scores=None):
+        self._entries = []
+        self._scores = {}
+        self._seats = {}
+        self._counter = itertools.count()
+        self.rebuild(scores or {})
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._scores
+
+    def __iter__(self):
+        return ((key, -neg) for neg, _, key in self._entries)
+
+    def _entry(self, key):
+        return (-self._scores[key], self._seats[key])
+
+    def update(self, key, score):
+        if key in self._scores:
+            if self._scores[key] == score:
+                return
+            del self._entries[bisect.bisect_left(self._entries, self._entry(key))]
+        else:
+            self._seats[key] = next(self._counter)
+        self._scores[key] = score
+        entry = self._entry(key)
+        self._entries.insert(bisect.bisect_left(self._entries, entry), entry + (key,))
+
+    def rebuild(self, scores):
+        # Bulk update: one sort instead of len(scores) bisect + memmove
+        # updates, for when most of the field changes at once.
+        for key, score in scores.items():
+            if key not in self._seats:
+                self._seats[key] = next(self._counter)
+            self._scores[key] = score
+        self._entries = sorted((-score, self._seats[key], key) for key, score in self._scores.items())
+
+    def remove(self, key):
+        del self._entries[bisect.bisect_left(self._entries, self._entry(key))]
+        del self._scores[key]
+        del self._seats[key]
+
+    def score(self, key):
+        return self._scores[key]
+
+    def rank(self, key):
+        return bisect.bisect_left(self._entries, self._entry(key)) + 1
+
+    def top(self, k=10):
+        return [(key, -neg) for neg, _, key in self._entries[:k]]
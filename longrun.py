@@ -0,0 +1,257 @@
+import argparse
+import os
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+
+from sweep import TABLE_POLICIES, COLLAPSE_THRESHOLD
+from vecenv import FishTycoonVecEnv
+
+
+# --- STREAMING AGGREGATES ---
+# Everything below keeps O(1) memory in the number of years simulated.
+class RunningStats:
+    # Welford mean / variance plus min / max, elementwise over an array
+    def __init__(self, shape=()):
+        self.n = 0
+        self.mean = np.zeros(shape)
+        self.m2 = np.zeros(shape)
+        self.min = np.full(shape, np.inf)
+        self.max = np.full(shape, -np.inf)
+
+    def update(self, x):
+        self.n += 1
+        delta = x - self.mean
+        self.mean = self.mean + delta / self.n
+        self.m2 = self.m2 + delta * (x - self.mean)
+        self.min = np.minimum(self.min, x)
+        self.max = np.maximum(self.max, x)
+
+    @property
+    def std(self):
+        return np.sqrt(self.m2 / max(1, self.n - 1))
+
+
+class Histogram:
+    # Fixed bins over [lo, hi]: quantiles to within one bin width, values
+    # outside the range land in the edge bins.
+    def __init__(self, lo=0.0, hi=1.0, bins=1000):
+        self.lo, self.hi, self.bins = lo, hi, bins
+        self.counts = np.zeros(bins, dtype=np.int64)
+
+    def update(self, x):
+        idx = np.clip(((np.asarray(x) - self.lo) / (self.hi - self.lo) * self.bins).astype(np.int64), 0, self.bins - 1)
+        self.counts += np.bincount(idx.ravel(), minlength=self.bins)
+
+    def quantile(self, q):
+        cum = np.cumsum(self.counts)
+        if cum[-1] == 0:
+            return np.full(np.shape(q), np.nan)
+        idx = np.searchsorted(cum, np.asarray(q) * cum[-1], side="left")
+        return self.lo + (np.minimum(idx, self.bins - 1) + 0.5) * (self.hi - self.lo) / self.bins
+
+
+class CollapseCounter:
+    # Per env: years spent below the threshold, number of separate collapse
+    # episodes, first collapse year and the longest spell.
+    def __init__(self, n, threshold=COLLAPSE_THRESHOLD):
+        self.threshold = threshold
+        self.years_below = np.zeros(n, dtype=np.int64)
+        self.episodes = np.zeros(n, dtype=np.int64)
+        self.first_year = np.full(n, -1, dtype=np.int64)
+        self.spell = np.zeros(n, dtype=np.int64)
+        self.longest = np.zeros(n, dtype=np.int64)
+
+    def update(self, year, density):
+        below = density < self.threshold
+        self.episodes += below & (self.spell == 0)
+        self.first_year = np.where(below & (self.first_year < 0), year, self.first_year)
+        self.spell = np.where(below, self.spell + 1, 0)
+        self.years_below += below
+        self.longest = np.maximum(self.longest, self.spell)
+
+
+# --- DOWNSAMPLED SERIES ---
+# Retention policy: the last `recent` years at full resolution in a ring
+# buffer, plus at most `points` older block means. Each block averages
+# `stride` years; when the archive fills up, neighbouring blocks merge and
+# the stride doubles, so the whole horizon stays covered at a resolution
+# that coarsens as the run gets longer.
+class Downsampler:
+    def __init__(self, columns, recent=1000, points=1024):
+        if points % 2:
+            raise ValueError("points must be even")
+        self.columns = tuple(columns)
+        k = len(self.columns)
+        self.recent_years = np.zeros(recent, dtype=np.int64)
+        self.recent = np.zeros((recent, k))
+        self.n_recent = 0
+        self.archive_years = np.zeros(points, dtype=np.int64)
+        self.archive = np.zeros((points, k))
+        self.n_archive = 0
+        self.stride = 1
+        self._block_sum = np.zeros(k)
+        self._block_n = 0
+        self._block_start = 0
+
+    def append(self, year, row):
+        row = np.asarray(row, dtype=float)
+        slot = self.n_recent % len(self.recent)
+        self.recent_years[slot] = year
+        self.recent[slot] = row
+        self.n_recent += 1
+
+        if self._block_n == 0:
+            self._block_start = year
+        self._block_sum += row
+        self._block_n += 1
+        if self._block_n == self.stride:
+            if self.n_archive == len(self.archive):
+                half = self.n_archive // 2
+                self.archive[:half] = (self.archive[0::2] + self.archive[1::2]) / 2
+                self.archive_years[:half] = self.archive_years[0::2]
+                self.n_archive = half
+                self.stride *= 2
+            if self._block_n == self.stride:
+                self.archive[self.n_archive] = self._block_sum / self._block_n
+                self.archive_years[self.n_archive] = self._block_start
+                self.n_archive += 1
+                self._block_sum[:] = 0
+                self._block_n = 0
+
+    def frame(self):
+        # One table, oldest first: archived block means (stride > 1 after
+        # merges) up to where the full-resolution tail takes over.
+        n = min(self.n_recent, len(self.recent))
+        order = (np.arange(n) + (self.n_recent - n)) % len(self.recent)
+        # The block still filling up is included as a partial mean.
+        years, rows = self.archive_years[:self.n_archive], self.archive[:self.n_archive]
+        widths = np.full(self.n_archive, self.stride)
+        if self._block_n:
+            years = np.append(years, self._block_start)
+            rows = np.vstack([rows, self._block_sum / self._block_n])
+            widths = np.append(widths, self._block_n)
+        keep = years < (self.recent_years[order[0]] if n else 0)
+        archive = pd.DataFrame(rows[keep], columns=self.columns)
+        archive.insert(0, "year", years[keep])
+        archive.insert(1, "years_averaged", widths[keep])
+        recent = pd.DataFrame(self.recent[order], columns=self.columns)
+        recent.insert(0, "year", self.recent_years[order])
+        recent.insert(1, "years_averaged", 1)
+        return pd.concat([archive, recent], ignore_index=True)
+
+
+# --- LONG RUN ---
+SERIES_COLUMNS = ("mean_density", "min_density", "mean_catch", "mean_wealth", "collapsed_share")
+OPEN_HORIZON = 2**62   # env.max_years: a long run never reaches the last year
+
+
+class LongRun:
+    def __init__(self, envs=64, players=4, policy="greedy", seed=0, threshold=COLLAPSE_THRESHOLD,
+                 recent=1000, points=1024, scenario=None):
+        if policy not in TABLE_POLICIES:
+            raise ValueError(f"unknown policy '{policy}'")
+        self.policy = policy
+        # No auto-reset and no end of game: every env is one fishery that
+        # keeps going, so bots never play end-game moves and a run split
+        # into chunks (or resumed from a checkpoint) matches an unbroken one.
+        self.env = FishTycoonVecEnv(envs, players, max_years=OPEN_HORIZON, seed=seed, auto_reset=False,
+                                    scenario=scenario)
+        self.capacity = self.env.params["max_fish_capacity"]
+        self.years_done = 0
+        self.density = RunningStats(envs)
+        self.catch = RunningStats(envs)
+        self.density_hist = Histogram(0.0, 1.0)
+        self.collapse = CollapseCounter(envs, threshold)
+        self.series = Downsampler(SERIES_COLUMNS, recent, points)
+
+    def run(self, years, checkpoint=None, every=10_000, progress=None):
+        env, act = self.env, TABLE_POLICIES[self.policy]
+        for _ in range(years):
+            _, _, _, info = env.step(act(env))
+            self.years_done += 1
+            density = (env.fish_shore + env.fish_deep) / self.capacity
+            catch = info["total_mass"] / self.capacity
+            self.density.update(density)
+            self.catch.update(catch)
+            self.density_hist.update(density)
+            self.collapse.update(self.years_done, density)
+            self.series.append(self.years_done, (
+                density.mean(), density.min(), catch.mean(), env.wealth().mean(),
+                (self.collapse.spell > 0).mean(),
+            ))
+            if self.years_done % every == 0:
+                if checkpoint:
+                    self.save(checkpoint)
+                if progress:
+                    progress(self)
+        if checkpoint:
+            self.save(checkpoint)
+
+    def summary(self):
+        q = self.density_hist.quantile([0.05, 0.5, 0.95])
+        return {
+            "years": self.years_done,
+            "envs": self.env.num_envs,
+            "policy": self.policy,
+            "mean_density": float(self.density.mean.mean()),
+            "density_std": float(self.density.std.mean()),
+            "density_p05": float(q[0]), "density_p50": float(q[1]), "density_p95": float(q[2]),
+            "mean_catch": float(self.catch.mean.mean()),
+            "collapse_rate": float((self.collapse.episodes > 0).mean()),
+            "collapse_episodes": float(self.collapse.episodes.mean()),
+            "years_collapsed_share": float(self.collapse.years_below.mean() / max(1, self.years_done)),
+            "longest_collapse": int(self.collapse.longest.max()),
+        }
+
+    # --- checkpointing ---
+    def save(self, path):
+        # Write-then-rename so a crash mid-write never loses the last checkpoint
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def load(path):
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Long-horizon fishery stability runs with bounded memory")
+    parser.add_argument("--years", type=int, default=10_000, help="years to simulate (added to a resumed run)")
+    parser.add_argument("--envs", type=int, default=64)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--policy", choices=sorted(TABLE_POLICIES), default="cautious")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--threshold", type=float, default=COLLAPSE_THRESHOLD, help="collapse below this stock density")
+    parser.add_argument("--recent", type=int, default=1000, help="years kept at full resolution")
+    parser.add_argument("--points", type=int, default=1024, help="downsampled points kept for older years")
+    parser.add_argument("--checkpoint", help="pickle the run here periodically")
+    parser.add_argument("--every", type=int, default=10_000, help="checkpoint / progress interval in years")
+    parser.add_argument("--resume", help="continue from a checkpoint")
+    parser.add_argument("--series", help="write the downsampled time series to CSV")
+    args = parser.parse_args()
+
+    if args.resume:
+        run = LongRun.load(args.resume)
+    else:
+        run = LongRun(args.envs, args.players, args.policy, args.seed, args.threshold, args.recent, args.points)
+
+    start = time.perf_counter()
+    run.run(args.years, args.checkpoint, args.every,
+            progress=lambda r: print(f"  year {r.years_done:,}: mean density {r.density.mean.mean():.3f}"))
+    elapsed = time.perf_counter() - start
+    print(f"{args.years:,} years x {run.env.num_envs} fisheries in {elapsed:.1f}s")
+    for key, value in run.summary().items():
+        print(f"  {key}: {value}")
+    if args.series:
+        run.series.frame().to_csv(args.series, index=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,446 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+
+from rich.panel import Panel
+from rich.table import Table
+
+from dashboard import Dashboard
+from events import EVENTS, EVENT_MODEL
+from game_archive import GameRecorder
+from leaderboard import Leaderboard
+from local4p import Ocean, Player, offer_contract, compute_price, resolve_auction, settle_accounts, net_worth
+from scenario import SCENARIO, BASE_FISH_PRICE, SHIP_COST, STORAGE_COST
+
+ARCHIVE_PATH = os.path.join("archives", "netplay.fta")
+DEFAULT_PORT = 8765
+
+# --- PROTOCOL ---
+# Newline-delimited JSON over TCP. Clients send {"type": "join", "name"},
+# then answer every {"type": "ask", "phase", "seq", "seat", ...} with
+# {"type": "decision", "phase", "seq", ...}. The server also pushes "lobby",
+# "report" and "gameover" messages. Every player of a phase is asked at
+# once and the year moves on when the last answer arrives, so a round takes
+# as long as the slowest player rather than the sum of everyone's turns.
+# Decisions are clamped to the same bounds the hot-seat prompts enforce;
+# late answers (seq of a question that already timed out) are discarded.
+#
+# A server can also hold in-process bot seats (add_bot) and a fixed seating
+# (names in seat order); remote players then join under one of the free
+# names. tournament.py uses both to put humans at tables with policy bots.
+
+async def send(writer, msg):
+    writer.write(json.dumps(msg).encode() + b"\n")
+    await writer.drain()
+
+
+async def receive(reader):
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("connection closed")
+    return json.loads(line)
+
+
+def clamp(value, lo, hi):
+    try:
+        return max(lo, min(hi, int(value)))
+    except (TypeError, ValueError):
+        return lo
+
+
+# --- SERVER ---
+class Seat:
+    def __init__(self, player, reader, writer):
+        self.player = player
+        self.reader = reader
+        self.writer = writer
+        self.connected = True
+        self.seq = 0
+
+    async def send(self, msg):
+        if not self.connected:
+            return
+        try:
+            await send(self.writer, msg)
+        except ConnectionError:
+            self.connected = False
+
+    async def ask(self, msg, timeout=None):
+        # Disconnected, slow or malformed players pass (empty decision)
+        self.seq += 1
+        await self.send(dict(msg, type="ask", seq=self.seq))
+        if not self.connected:
+            return {}
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            remaining = None if deadline is None else max(0, deadline - loop.time())
+            try:
+                reply = await asyncio.wait_for(receive(self.reader), remaining)
+            except asyncio.TimeoutError:
+                return {}
+            except (ConnectionError, ValueError):
+                self.connected = False
+                return {}
+            # Answers to earlier, timed-out questions are still queued, and
+            # junk lines carry no seq: skip both and keep waiting
+            if isinstance(reply, dict) and reply.get("seq") == self.seq:
+                return reply if reply.get("phase") == msg["phase"] else {}
+
+
+class BotSeat(Seat):
+    # In-process seat: `decide(msg)` answers every ask, nothing goes on the wire
+    def __init__(self, player, decide):
+        super().__init__(player, None, None)
+        self.decide = decide
+
+    async def send(self, msg):
+        pass
+
+    async def ask(self, msg, timeout=None):
+        self.seq += 1
+        return dict(self.decide(dict(msg, type="ask", seq=self.seq)), phase=msg["phase"], seq=self.seq)
+
+
+class GameServer:
+    def __init__(self, num_players, years, turn_timeout=None, seed=None, seating=None, archive_path=ARCHIVE_PATH):
+        self.num_players = num_players
+        self.years = years
+        self.turn_timeout = turn_timeout
+        self.seed = random.randrange(2**32) if seed is None else seed
+        self.seating = seating   # names in seat order, or None for first come first seated
+        self.archive_path = archive_path
+        self.seats = []
+        self.final_wealth = None   # per seat, once the game is over
+        self.full = asyncio.Event()
+        self.done = asyncio.Event()
+
+    def add_bot(self, name, decide):
+        self.seats.append(BotSeat(Player(name), decide))
+        if len(self.seats) == self.num_players:
+            self.full.set()
+
+    async def _join(self, reader, writer):
+        try:
+            hello = await receive(reader)
+        except (ConnectionError, ValueError):
+            writer.close()
+            return
+        if self.full.is_set() or not isinstance(hello, dict) or hello.get("type") != "join":
+            await send(writer, {"type": "error", "message": "Game is full."})
+            writer.close()
+            return
+        name = str(hello.get("name") or f"Player {len(self.seats) + 1}")
+        if self.seating is None:
+            name = name[:20]
+        elif name not in self.seating or any(s.player.name == name for s in self.seats):
+            await send(writer, {"type": "error", "message": f"No open seat for {name} at this table."})
+            writer.close()
+            return
+        self.seats.append(Seat(Player(name), reader, writer))
+        await self.broadcast({"type": "lobby", "joined": [s.player.name for s in self.seats],
+                              "needed": self.num_players})
+        if len(self.seats) == self.num_players:
+            self.full.set()
+        await self.done.wait()
+        writer.close()
+
+    async def broadcast(self, msg):
+        await asyncio.gather(*(s.send(msg) for s in self.seats))
+
+    async def gather(self, requests):
+        # requests: {seat: message}; every player answers in parallel
+        seats = list(requests)
+        replies = await asyncio.gather(*(s.ask(requests[s], self.turn_timeout) for s in seats))
+        return dict(zip(seats, replies))
+
+    def public_state(self, year, fish_price, contract_qty=0, contract_price=0.0):
+        event = self.ocean.current_event
+        outlook, chance = EVENT_MODEL.outlook(event.id)
+        return {
+            "year": year, "event": event.name, "description": event.description,
+            "outlook": outlook.name, "outlook_chance": chance,
+            "shore": int(self.ocean.fish_shore), "deep": int(self.ocean.fish_deep),
+            "fish_price": fish_price, "ship_price": self.ocean.get_ship_market_price(),
+            "contract_qty": contract_qty, "contract_price": contract_price,
+        }
+
+    @staticmethod
+    def private_state(p):
+        return {"name": p.name, "cash": p.cash, "ships": p.ships, "pending": p.pending_ships,
+                "freezer": p.freezer, "last_profit": p.last_profit, "last_catch": p.last_catch}
+
+    async def serve(self, host="127.0.0.1", port=DEFAULT_PORT):
+        server = await asyncio.start_server(self._join, host, port)
+        print(f"Waiting for {self.num_players - len(self.seats)} players on {host}:{port} ...")
+        async with server:
+            await self.full.wait()
+            server.close()
+            try:
+                await self.play()
+            finally:
+                self.done.set()
+
+    async def play(self):
+        random.seed(self.seed)
+        self.ocean = ocean = Ocean()
+        if self.seating:
+            self.seats.sort(key=lambda s: self.seating.index(s.player.name))
+        players = [s.player for s in self.seats]
+        index = {s: i for i, s in enumerate(self.seats)}
+        recorder = GameRecorder("netplay", dict(SCENARIO, max_years=self.years), self.seed,
+                                [p.name for p in players], [e.name for e in EVENTS])
+        profit_board = Leaderboard({p: 0 for p in players})
+        fish_price = BASE_FISH_PRICE
+
+        for year in range(1, self.years + 1):
+            ocean.trigger_event()
+            contract_qty, contract_price = offer_contract(players, fish_price)
+            public = self.public_state(year, fish_price, contract_qty, contract_price)
+
+            def ask(phase, s, **extra):
+                return dict(phase=phase, seat=index[s], public=public, private=self.private_state(s.player), **extra)
+
+            # Auction: listings, then sealed bids on every lot
+            replies = await self.gather({s: ask("list", s) for s in self.seats if s.player.ships > 0})
+            listings = []
+            for s, r in replies.items():
+                qty = clamp(r.get("qty"), 0, s.player.ships)
+                if qty > 0:
+                    min_p = clamp(r.get("min"), 0, 999999)
+                    listings.append({'seller': s.player, 'seat': index[s], 'qty': qty, 'min': min_p})
+                    recorder.action(year, index[s], "list", qty, min_p)
+
+            auction = []
+            if listings:
+                # Sellers are identified by seat: captains' names need not be unique
+                lots = [{"lot": i, "seller": lot['seller'].name, "seller_seat": lot['seat'], "qty": lot['qty']}
+                        for i, lot in enumerate(listings)]
+                replies = await self.gather({s: ask("bid", s, lots=lots) for s in self.seats})
+                all_bids = {i: {} for i in range(len(listings))}
+                for s, r in replies.items():
+                    max_bid = max(0, int(s.player.cash))
+                    bids = r.get("bids")
+                    if not isinstance(bids, dict):
+                        bids = {}
+                    for i, lot in enumerate(listings):
+                        if lot['seller'] is s.player:
+                            continue
+                        bid = clamp(bids.get(str(i)), 0, max_bid)
+                        all_bids[i][s.player] = bid
+                        if bid > 0:
+                            recorder.action(year, index[s], "bid", i, bid)
+                auction = [{"seller": lot['seller'].name, "qty": lot['qty'], "min": lot['min'],
+                            "winner": winner.name if winner else None, "price": price}
+                           for lot, winner, price in resolve_auction(listings, all_bids)]
+
+            # Action phase: contract, shipyard and fleet orders
+            replies = await self.gather({s: ask("action", s, auction=auction) for s in self.seats})
+            for s, r in replies.items():
+                p = s.player
+                p.accepted_contract = bool(r.get("accept"))
+                order = clamp(r.get("order"), 0, max(0, int(p.cash // SHIP_COST)))
+                p.cash -= order * SHIP_COST
+                p.pending_ships += order
+                shore = clamp(r.get("shore"), 0, p.ships)
+                deep = clamp(r.get("deep"), 0, p.ships - shore)
+                p.set_allocation(shore, deep)
+                recorder.action(year, index[s], "contract", int(p.accepted_contract), contract_qty)
+                recorder.action(year, index[s], "order", order)
+                recorder.action(year, index[s], "allocate", shore, deep)
+
+            # Simulation
+            catches, total_mass = ocean.calculate_catch(players)
+            fish_price = compute_price(total_mass)
+
+            # Sales & storage
+            requests = {}
+            for s in self.seats:
+                p = s.player
+                p.last_catch = catches[p]['shore'] + catches[p]['deep']
+                requests[s] = ask("freeze", s, catch=int(p.last_catch), available=int(p.last_catch + p.freezer),
+                                  fish_price=fish_price, storage_cost=STORAGE_COST,
+                                  contract=contract_qty if p.accepted_contract else 0)
+            replies = await self.gather(requests)
+
+            # Accounting
+            for s, r in replies.items():
+                p = s.player
+                available = requests[s]["available"]
+                to_freeze = clamp(r.get("freeze"), 0, available)
+                recorder.action(year, index[s], "freeze", to_freeze, available - to_freeze)
+                contract_status = p.accepted_contract
+                profit = settle_accounts(p, to_freeze, available - to_freeze, contract_qty, contract_price, fish_price)
+                profit_board.update(p, profit)
+                recorder.year_result(year, index[s], p.ships, p.last_catch, to_freeze, contract_status, profit, p.cash)
+                p.accepted_contract = False
+
+            ocean.reproduce_fish()
+            recorder.ocean_state(year, ocean.fish_shore, ocean.fish_deep, fish_price, ocean.current_event.name)
+
+            standings = [{"name": p.name, "catch": int(catches[p]['shore'] + catches[p]['deep']),
+                          "stored": int(p.freezer), "profit": p.last_profit, "cash": p.cash}
+                         for p, _ in profit_board]
+            public = self.public_state(year, fish_price)
+            await asyncio.gather(*(s.send({"type": "report", "public": public, "private": self.private_state(s.player),
+                                           "standings": standings, "total_catch": total_mass})
+                                   for s in self.seats))
+
+        worth = net_worth(players, ocean, fish_price)
+        self.final_wealth = [worth[p] for p in players]
+        wealth_board = Leaderboard(worth)
+        await self.broadcast({"type": "gameover", "standings": [{"name": p.name, "wealth": w} for p, w in wealth_board]})
+        try:
+            recorder.save(self.archive_path)
+        except OSError:
+            print("Could not write game archive.")
+
+
+# --- CLIENT ---
+class Client:
+    def __init__(self, name, low_bandwidth=False):
+        self.name = name
+        self.ui = Dashboard(low_bandwidth=low_bandwidth)
+
+    def show(self, msg):
+        ui = self.ui
+        pub, me = msg.get("public"), msg.get("private")
+        if pub:
+            ui.update("ecology", (pub["event"], pub["shore"], pub["deep"]), lambda: Panel(
+                f"[bold]{pub['event']}[/bold]\n{pub['description']}\n"
+                f"[dim]Next year's outlook: {pub['outlook']} ({int(pub['outlook_chance'] * 100)}%)[/dim]\n\n"
+                f"Shore Population: [magenta]{pub['shore']}[/magenta]\n"
+                f"Deep Population:  [magenta]{pub['deep']}[/magenta]",
+                title="📢 WEATHER & ECOLOGY", box=ui.box))
+            ui.update("market", (pub["fish_price"], pub["ship_price"], pub["contract_qty"]), lambda: Panel(
+                f"Fish Price:        [magenta]${round(pub['fish_price'], 2)}[/magenta] / unit\n"
+                f"Ship Resale Value: [magenta]${pub['ship_price']}[/magenta] / ship\n\n"
+                + (f"[bold]Contract:[/bold] deliver [bold green]{pub['contract_qty']}[/bold green] units @ "
+                   f"[bold green]${pub['contract_price']}[/bold green]/unit" if pub["contract_qty"] else ""),
+                title="📜 MARKET", border_style="gold1", box=ui.box))
+        if me:
+            ui.update("private", tuple(int(me[k]) for k in ("cash", "ships", "pending", "freezer", "last_profit", "last_catch")),
+                      lambda: Panel(
+                          f"[bold]Cash:[/bold] ${int(me['cash'])}    [bold]Fleet:[/bold] {me['ships']} ships"
+                          + (f" [dim](+{me['pending']} pending)[/dim]" if me["pending"] else "") + "\n"
+                          f"[bold]Last Profit:[/bold] ${int(me['last_profit'])}    "
+                          f"[bold]Last Catch:[/bold] {int(me['last_catch'])} units\n"
+                          f"[bold]In Freezer:[/bold] {int(me['freezer'])} units",
+                          title=f"[bold gold1]{me['name']}'s Dashboard[/bold gold1]", border_style="gold1", box=ui.box))
+
+    def decide(self, msg):
+        # Runs in a worker thread: blocking prompts don't stall the socket
+        ui, phase, me = self.ui, msg["phase"], msg["private"]
+        year = msg["public"]["year"]
+        if phase == "list":
+            ui.header(f"YEAR {year} - AUCTION HOUSE (Market Val: ${msg['public']['ship_price']})")
+            qty = ui.ask_int("Ships to list for sale (0 to skip):", 0, me["ships"])
+            min_p = ui.ask_int(f"Minimum TOTAL price for lot of {qty} ships:", 0, 999999) if qty else 0
+            return {"qty": qty, "min": min_p}
+        if phase == "bid":
+            ui.header(f"YEAR {year} - BIDDING")
+            table = Table(box=ui.box, expand=True)
+            for col in ("Lot", "Seller", "Ships"):
+                table.add_column(col)
+            for lot in msg["lots"]:
+                table.add_row(f"#{lot['lot'] + 1}", lot["seller"], str(lot["qty"]))
+            ui.body(("lots", year), table)
+            max_bid = max(0, int(me["cash"]))
+            return {"bids": {str(lot["lot"]): ui.ask_int(f"Sealed bid for lot #{lot['lot'] + 1} (max {max_bid}):", 0, max_bid)
+                             for lot in msg["lots"] if lot["seller_seat"] != msg["seat"]}}
+        if phase == "action":
+            ui.header(f"YEAR {year} - ACTION PHASE")
+            sold = [a for a in msg["auction"] if a["winner"]]
+            ui.body(("auction", year), "\n".join(f"Lot of {a['qty']} from {a['seller']}: SOLD to {a['winner']} (${a['price']})"
+                                                 for a in sold) or "No ships changed hands.")
+            accept = ui.confirm("Accept contract?")
+            order = ui.ask_int(f"Ships to order at ${SHIP_COST}:", 0, max(0, int(me["cash"] // SHIP_COST)))
+            shore = ui.ask_int("Ships to SHORE:", 0, me["ships"])
+            deep = ui.ask_int(f"Ships to DEEP (max {me['ships'] - shore}):", 0, me["ships"] - shore)
+            return {"accept": accept, "order": order, "shore": shore, "deep": deep}
+        if phase == "freeze":
+            ui.header(f"YEAR {year} - SALES & STORAGE")
+            ui.body(("sales", year), Panel(
+                f"Catch this year: {msg['catch']}    TOTAL AVAILABLE: [bold]{msg['available']}[/bold]\n"
+                f"Market Price: ${msg['fish_price']} / unit    Freezer Cost: ${msg['storage_cost']} / unit"
+                + (f"\n[bold yellow]CONTRACT ACTIVE:[/bold yellow] deliver {msg['contract']} units from unfrozen fish"
+                   if msg["contract"] else ""), box=ui.box))
+            return {"freeze": ui.ask_int("Units to FREEZE for next year:", 0, msg["available"])}
+        return {}
+
+    def show_standings(self, title, rows, columns):
+        table = Table(title=title, box=self.ui.box, expand=True)
+        for col in columns:
+            table.add_column(col.title())
+        for row in rows:
+            table.add_row(*(f"${int(row[c])}" if c in ("profit", "cash", "wealth") else str(row[c]) for c in columns))
+        self.ui.body((title,), table)
+
+    async def run(self, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        await send(writer, {"type": "join", "name": self.name})
+        ui = self.ui
+        with ui:
+            ui.header("Connecting...")
+            while True:
+                try:
+                    msg = await receive(reader)
+                except ConnectionError:
+                    ui.say("[red]Server closed the connection.[/red]")
+                    break
+                kind = msg.get("type")
+                self.show(msg)
+                if kind == "lobby":
+                    ui.header(f"LOBBY: {len(msg['joined'])}/{msg['needed']} captains")
+                    ui.body(("lobby", tuple(msg["joined"])), "\n".join(msg["joined"]))
+                elif kind == "ask":
+                    ui.clear("body")
+                    decision = await asyncio.to_thread(self.decide, msg)
+                    await send(writer, dict(decision, type="decision", phase=msg["phase"], seq=msg.get("seq")))
+                    ui.header("Waiting for the other captains...")
+                    ui.refresh()
+                    continue
+                elif kind == "report":
+                    ui.header(f"🏆 YEAR {msg['public']['year']} RESULTS (total catch {int(msg['total_catch'])})")
+                    self.show_standings(f"Year {msg['public']['year']}", msg["standings"],
+                                        ("name", "catch", "stored", "profit", "cash"))
+                elif kind == "gameover":
+                    ui.header("=== GAME OVER ===")
+                    self.show_standings("Final Standings", msg["standings"], ("name", "wealth"))
+                    await asyncio.to_thread(ui.pause, "Press Enter to quit...")
+                    break
+                elif kind == "error":
+                    ui.say(f"[red]{msg['message']}[/red]")
+                    break
+                ui.refresh()
+        writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fish Tycoon over the network")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve = sub.add_parser("serve", help="host a game")
+    serve.add_argument("--players", type=int, default=4)
+    serve.add_argument("--years", type=int, default=10)
+    serve.add_argument("--host", default="0.0.0.0")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve.add_argument("--turn-timeout", type=float, default=None, help="seconds before a silent player passes")
+    serve.add_argument("--seed", type=int, default=None)
+    join = sub.add_parser("join", help="join a hosted game")
+    join.add_argument("name")
+    join.add_argument("--host", default="127.0.0.1")
+    join.add_argument("--port", type=int, default=DEFAULT_PORT)
+    join.add_argument("--low-bandwidth", action="store_true")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        server = GameServer(args.players, args.years, args.turn_timeout, args.seed)
+        asyncio.run(server.serve(args.host, args.port))
+    else:
+        asyncio.run(Client(args.name, args.low_bandwidth).run(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import heapq
+import itertools
+
+
+# --- CONTRACT ORDER BOOK ---
+# Buyer contracts rest in a heap keyed (-price, seq), i.e. best price first
+# and oldest first among equal prices. Players' sell offers are matched
+# against it in one batch: cost is O(fills * log n) no matter how many
+# orders are resting, and expired contracts are dropped lazily when they
+# reach the top of the heap.
+class ContractBook:
+    def __init__(self):
+        self._heap = []
+        self._orders = {}
+        self._seq = itertools.count()
+
+    def __len__(self):
+        return len(self._orders)
+
+    def add_bid(self, qty, price, expires):
+        order_id = next(self._seq)
+        self._orders[order_id] = {'id': order_id, 'qty': qty, 'price': price, 'expires': expires}
+        heapq.heappush(self._heap, (-price, order_id))
+        return order_id
+
+    def cancel(self, order_id):
+        # Lazy delete: the heap entry is skipped when it surfaces
+        self._orders.pop(order_id, None)
+
+    def _best(self, year):
+        while self._heap:
+            order_id = self._heap[0][1]
+            order = self._orders.get(order_id)
+            if order is not None and order['expires'] >= year and order['qty'] > 0:
+                return order
+            heapq.heappop(self._heap)
+            self._orders.pop(order_id, None)
+        return None
+
+    def best_bids(self, n=5, year=0):
+        live = (self._orders.get(oid) for _, oid in heapq.nsmallest(n * 2, self._heap))
+        return [o for o in live if o and o['expires'] >= year][:n]
+
+    def match(self, offers, year):
+        # offers: [(seller, qty, min_price), ...] in submission order.
+        # Price-time priority on both sides; trades at the resting buyer's
+        # price. Returns fills as [(order_id, seller, qty, price), ...].
+        asks = sorted(
+            ((min_price, i, seller, qty) for i, (seller, qty, min_price) in enumerate(offers) if qty > 0),
+            key=lambda a: (a[0], a[1]),
+        )
+        fills = []
+        for min_price, _, seller, qty in asks:
+            while qty > 0:
+                order = self._best(year)
+                if order is None or order['price'] < min_price:
+                    return fills
+                fill = min(qty, order['qty'])
+                fills.append((order['id'], seller, fill, order['price']))
+                order['qty'] -= fill
+                qty -= fill
+        return fills
+
+    def expire(self, year):
+        # Drop everything that ran out before `year` and rebuild the heap
+        self._orders = {oid: o for oid, o in self._orders.items() if o['expires'] >= year and o['qty'] > 0}
+        self._heap = [(-o['price'], oid) for oid, o in self._orders.items()]
+        heapq.heapify(self._heap)
+
+
+# --- SETTLEMENT ---
+def settle(fills, to_sell, penalty_mult):
+    # Batch delivery for one STORAGE resolution. to_sell maps seller -> units
+    # not frozen; contract fish comes out of that pile. Fills are delivered in
+    # match order, shortfalls are charged penalty_mult x the contract price.
+    results = {s: {'filled': 0, 'delivered': 0, 'revenue': 0.0, 'penalty': 0.0, 'remaining': q}
+               for s, q in to_sell.items()}
+    for _, seller, qty, price in fills:
+        r = results[seller]
+        delivered = min(qty, r['remaining'])
+        r['filled'] += qty
+        r['delivered'] += delivered
+        r['remaining'] -= delivered
+        r['revenue'] += delivered * price
+        r['penalty'] += (qty - delivered) * price * penalty_mult
+    return results
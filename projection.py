@@ -0,0 +1,134 @@
+import argparse
+import functools
+
+import numpy as np
+
+from events import EVENT_MODEL, EVENTS
+from scenario import (
+    MAX_FISH_CAPACITY, SHORE_SHARE, SHORE_GROWTH, DEEP_GROWTH,
+    SHORE_EFFICIENCY, DEEP_EFFICIENCY, CROWDING_KNEE, CROWDING_SLOPE,
+)
+
+GROUNDS = ("shore", "deep")
+MAX_FLEET = 200   # largest fleet per ground the MSY search considers
+
+
+# --- SINGLE-GROUND MODEL ---
+# One year on a ground is "fish, then grow": the fleet removes a fraction
+# f(N) of the stock (same catch formula as Ocean.calculate_catch) and the
+# survivors grow logistically (Ocean.reproduce_fish). With X the stock left
+# after fishing, the equilibrium X* = K (1 + r - 1 / (1 - f)) / r holds
+# whenever that is positive; otherwise the fleet fishes the ground out.
+def ground_params(ground, event=0):
+    e = EVENTS[event]
+    if ground == "shore":
+        return MAX_FISH_CAPACITY * SHORE_SHARE, SHORE_GROWTH + e.growth_mod, SHORE_EFFICIENCY * e.shore_mod
+    return MAX_FISH_CAPACITY * (1 - SHORE_SHARE), DEEP_GROWTH + e.growth_mod, DEEP_EFFICIENCY * e.deep_mod
+
+
+def harvest_fraction(ships, efficiency):
+    ships = np.asarray(ships, dtype=float)
+    penalty = 1.0 / (1 + np.maximum(0, ships - CROWDING_KNEE) * CROWDING_SLOPE)
+    return np.minimum(1.0, efficiency * ships * penalty)
+
+
+def _steady_states(ground, ships, event):
+    # Vectorised over fleets: (stock at season start, yearly catch)
+    capacity, r, eff = ground_params(ground, event)
+    f = harvest_fraction(ships, eff)
+    if r <= 0:
+        stock = np.where(f == 0, capacity, 0.0) if r == 0 else np.zeros_like(f)
+    else:
+        with np.errstate(divide="ignore"):
+            left = capacity * (1 + r - 1 / (1 - f)) / r
+        stock = np.where(f < 1, np.maximum(0, left) / np.where(f < 1, 1 - f, 1), 0.0)
+    return stock, f * stock
+
+
+@functools.lru_cache(maxsize=1024)
+def steady_state(ground, ships, event=0):
+    stock, catch = _steady_states(ground, ships, event)
+    return float(stock), float(catch)
+
+
+@functools.lru_cache(maxsize=None)
+def msy(ground, event=0):
+    # Integer fleet with the highest sustainable yearly catch
+    fleets = np.arange(MAX_FLEET + 1)
+    stock, catch = _steady_states(ground, fleets, event)
+    best = int(catch.argmax())
+    return {"ships": best, "catch": float(catch[best]), "stock": float(stock[best])}
+
+
+def msy_table():
+    return [dict(ground=g, event=e.name, **msy(g, e.id)) for e in EVENTS for g in GROUNDS]
+
+
+# --- PROJECTIONS ---
+def _expected_mods(current, prev, years):
+    # Probability-weighted weather for each projected year. If this
+    # season's event is already known it is year 1 and the Markov forecast
+    # starts in year 2; between seasons the forecast follows `prev`.
+    if current is None:
+        probs = EVENT_MODEL.forecast(prev, years)
+    else:
+        probs = np.zeros((years, len(EVENTS)))
+        probs[0, current] = 1.0
+        if years > 1:
+            probs[1:] = EVENT_MODEL.forecast(current, years - 1)
+    return probs @ EVENT_MODEL.shore_mod, probs @ EVENT_MODEL.deep_mod, probs @ EVENT_MODEL.growth_mod
+
+
+@functools.lru_cache(maxsize=4096)
+def _project(shore, deep, fleet_shore, fleet_deep, event, current, prev, years):
+    if event is None:
+        shore_mod, deep_mod, growth_mod = _expected_mods(current, prev, years)
+    else:
+        e = EVENTS[event]
+        shore_mod, deep_mod, growth_mod = [e.shore_mod] * years, [e.deep_mod] * years, [e.growth_mod] * years
+    cap_shore = MAX_FISH_CAPACITY * SHORE_SHARE
+    cap_deep = MAX_FISH_CAPACITY * (1 - SHORE_SHARE)
+    rows = []
+    for y in range(years):
+        f_s = float(harvest_fraction(fleet_shore, SHORE_EFFICIENCY * shore_mod[y]))
+        f_d = float(harvest_fraction(fleet_deep, DEEP_EFFICIENCY * deep_mod[y]))
+        catch = shore * f_s + deep * f_d
+        shore, deep = shore * (1 - f_s), deep * (1 - f_d)
+        shore = max(0, shore + (SHORE_GROWTH + growth_mod[y]) * shore * (1 - shore / cap_shore))
+        deep = max(0, deep + (DEEP_GROWTH + growth_mod[y]) * deep * (1 - deep / cap_deep))
+        rows.append((y + 1, shore, deep, catch))
+    return tuple(rows)
+
+
+def project(shore, deep, fleet_shore, fleet_deep, years=5, event=None, current=None, prev=None):
+    # Deterministic N-year projection with a fixed fleet split, from a
+    # season-start stock (before this season's catch). `event` pins the
+    # weather for every year. Otherwise year 1 uses `current`, this season's
+    # already-drawn event, and later years the expected weather after it;
+    # between seasons pass `prev` (the season that just ended) instead.
+    # Cached by (stock, fleet, event), stock rounded to whole fish, so UI
+    # reruns on an unchanged ocean cost nothing.
+    return _project(int(shore), int(deep), int(fleet_shore), int(fleet_deep), event, current, prev, years)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sustainable fleet sizes and stock projections")
+    parser.add_argument("--shore", type=int, default=0, help="ships on the shore ground")
+    parser.add_argument("--deep", type=int, default=0, help="ships on the deep ground")
+    parser.add_argument("--years", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'Event':<16}{'Ground':<8}{'MSY fleet':>10}{'Catch/yr':>10}{'Stock':>10}")
+    for row in msy_table():
+        print(f"{row['event']:<16}{row['ground']:<8}{row['ships']:>10}{row['catch']:>10.0f}{row['stock']:>10.0f}")
+
+    from scenario import INITIAL_STOCK
+    shore0 = MAX_FISH_CAPACITY * SHORE_SHARE * INITIAL_STOCK
+    deep0 = MAX_FISH_CAPACITY * (1 - SHORE_SHARE) * INITIAL_STOCK
+    print(f"\nProjection with {args.shore} shore / {args.deep} deep ships (expected weather):")
+    for year, shore, deep, catch in project(shore0, deep0, args.shore, args.deep, args.years):
+        print(f"  year {year:>2}: shore {shore:>6.0f}  deep {deep:>6.0f}  catch {catch:>6.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import json
+import os
+
+# --- SCENARIO ---
+# Every balance constant lives in one JSON file so both frontends, the
+# vectorized env and the sweep tool play by the same numbers. Point
+# FISH_SCENARIO at another file to try a variant without touching code.
+SCENARIO_PATH = os.environ.get(
+    "FISH_SCENARIO", os.path.join(os.path.dirname(os.path.abspath(__file__)), "scenario.json")
+)
+
+
+def load_scenario(path=None, **overrides):
+    with open(path or SCENARIO_PATH) as f:
+        scenario = json.load(f)
+    unknown = set(overrides) - set(scenario)
+    if unknown:
+        raise KeyError(f"Unknown scenario keys: {', '.join(sorted(unknown))}")
+    scenario.update(overrides)
+    return scenario
+
+
+SCENARIO = load_scenario()
+
+MAX_FISH_CAPACITY = SCENARIO["max_fish_capacity"]
+SHORE_SHARE = SCENARIO["shore_share"]
+INITIAL_STOCK = SCENARIO["initial_stock"]
+SHORE_GROWTH = SCENARIO["shore_growth"]
+DEEP_GROWTH = SCENARIO["deep_growth"]
+SHORE_EFFICIENCY = SCENARIO["shore_efficiency"]
+DEEP_EFFICIENCY = SCENARIO["deep_efficiency"]
+CROWDING_KNEE = SCENARIO["crowding_knee"]
+CROWDING_SLOPE = SCENARIO["crowding_slope"]
+
+BASE_FISH_PRICE = SCENARIO["base_fish_price"]
+BASELINE_DEMAND = SCENARIO["baseline_demand"]
+PRICE_ELASTICITY = SCENARIO["price_elasticity"]
+PRICE_FLOOR = SCENARIO["price_floor"]
+PRICE_CEILING = SCENARIO["price_ceiling"]
+
+STARTING_CASH = SCENARIO["starting_cash"]
+STARTING_SHIPS = SCENARIO["starting_ships"]
+SHIP_COST = SCENARIO["ship_cost"]
+SHIP_SCRAP = SCENARIO["ship_scrap"]
+SHIP_PRICE_MAX = SCENARIO["ship_price_max"]
+STORAGE_COST = SCENARIO["storage_cost"]
+FREEZER_DISCOUNT = SCENARIO["freezer_discount"]
+HARBOR_COST = SCENARIO["harbor_cost"]
+SHORE_COST = SCENARIO["shore_cost"]
+DEEP_COST = SCENARIO["deep_cost"]
+
+CONTRACT_QTY_RANGE = tuple(SCENARIO["contract_qty_range"])
+CONTRACT_PRICE_MULT = SCENARIO["contract_price_mult"]
+CONTRACT_PENALTY_MULT = SCENARIO["contract_penalty_mult"]
+CONTRACT_LIFETIME = SCENARIO["contract_lifetime"]
+
+EVENT_CATALOG = SCENARIO["events"]
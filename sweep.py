@@ -0,0 +1,280 @@
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from scenario import load_scenario
+from vecenv import FishTycoonVecEnv, EVENT_SHORE_MOD, EVENT_DEEP_MOD
+
+# --- PARAMETER SPACE ---
+# The balance constants worth sweeping; ranges default to +/- SPREAD around
+# the scenario value and can be overridden with --range key=lo:hi.
+SWEEP_KEYS = (
+    "max_fish_capacity", "baseline_demand",
+    "shore_efficiency", "deep_efficiency", "crowding_knee", "crowding_slope",
+    "shore_growth", "deep_growth",
+    "storage_cost", "contract_price_mult", "contract_penalty_mult",
+)
+SPREAD = 0.25
+COLLAPSE_THRESHOLD = 0.10   # total stock below 10% of capacity at any point
+# collapse_rate is a yes/no per game; min_stock and years_to_collapse (the
+# full horizon if the stock never falls below the threshold) say how close
+# a setting comes, so they still vary where every game collapses or none do.
+METRICS = ("collapse_rate", "min_stock", "years_to_collapse", "gini", "mean_wealth", "final_stock")
+CACHE_DIR = ".sweep_cache"
+
+
+def default_ranges(scenario, keys=SWEEP_KEYS, spread=SPREAD):
+    return {k: (scenario[k] * (1 - spread), scenario[k] * (1 + spread)) for k in keys}
+
+
+# --- SAMPLERS ---
+# All samplers return an (N, D) array of points in the unit cube; scale()
+# maps them onto the parameter ranges.
+def grid_sampler(n_dims, n, rng, levels=3):
+    # The full grid when it fits in n points, otherwise n distinct grid
+    # nodes drawn at random (3 levels over 11 keys would be 177,147 points)
+    size = levels ** n_dims
+    nodes = np.arange(size) if size <= n else rng.choice(size, n, replace=False)
+    return np.stack(np.unravel_index(nodes, (levels,) * n_dims), axis=-1) / max(1, levels - 1)
+
+
+def lhs_sampler(n_dims, n, rng, **_):
+    # one point per stratum on every axis, strata shuffled independently
+    u = (np.arange(n)[:, None] + rng.random((n, n_dims))) / n
+    for d in range(n_dims):
+        u[:, d] = rng.permutation(u[:, d])
+    return u
+
+
+def sobol_sampler(n_dims, n, rng, **_):
+    try:
+        from scipy.stats import qmc
+    except ImportError:
+        raise SystemExit("Sobol sampling needs scipy (pip install scipy).")
+    return qmc.Sobol(n_dims, scramble=True, seed=rng).random(n)
+
+
+SAMPLERS = {"grid": grid_sampler, "lhs": lhs_sampler, "sobol": sobol_sampler}
+
+
+def scale(unit, ranges):
+    lo = np.array([r[0] for r in ranges.values()])
+    hi = np.array([r[1] for r in ranges.values()])
+    return lo + unit * (hi - lo)
+
+
+# --- BOT POLICIES ---
+def greedy_policy(env):
+    # Most of the fleet fishes, split by expected yield; buy when rich, sell
+    # nothing. Per-player noise keeps identical bots from tying every game.
+    p = env.params
+    w_s = env.fish_shore * p["shore_efficiency"] * EVENT_SHORE_MOD[env.event]
+    w_d = env.fish_deep * p["deep_efficiency"] * EVENT_DEEP_MOD[env.event]
+    frac = np.divide(w_s, w_s + w_d, out=np.full(w_s.shape, 0.5), where=(w_s + w_d) > 0)
+    fishing = np.round(env.ships * env.rng.uniform(0.5, 1.0, env.ships.shape))
+    shore = np.round(fishing * frac[:, None])
+    years_left = env.max_years - env.year[:, None]
+    threshold = env.rng.uniform(2, 4, env.cash.shape) * p["ship_cost"][:, None]
+    return {
+        "accept_contract": env.last_catch >= env.contract_qty[:, None],
+        "order": (env.cash > threshold) & (years_left > 3),
+        "shore": shore,
+        "deep": fishing - shore,
+        "freeze": np.zeros_like(env.cash),
+    }
+
+
+def cautious_policy(env):
+    # Half the fleet fishes the healthier ground, the rest stays in harbor;
+    # never buys ships or signs contracts.
+    p = env.params
+    shore_health = env.fish_shore / (p["max_fish_capacity"] * p["shore_share"])
+    deep_health = env.fish_deep / (p["max_fish_capacity"] * (1 - p["shore_share"]))
+    fishing = env.ships // 2
+    to_shore = (shore_health > deep_health)[:, None]
+    return {
+        "shore": np.where(to_shore, fishing, 0),
+        "deep": np.where(to_shore, 0, fishing),
+        "freeze": np.zeros_like(env.cash),
+    }
+
+
+def random_policy(env):
+    return env.random_actions()
+
+
+def mixed_policy(env):
+    # Greedy and cautious bots at every table (alternating seats): uneven
+    # fleets give inequality something to measure, and the stock neither
+    # always crashes (all greedy) nor never does (all cautious).
+    greedy, cautious = greedy_policy(env), cautious_policy(env)
+    seat = np.arange(env.num_players) % 2 == 0
+    return {k: np.where(seat, greedy.get(k, 0), cautious.get(k, 0)) for k in greedy.keys() | cautious.keys()}
+
+
+POLICIES = {"greedy": greedy_policy, "cautious": cautious_policy, "random": random_policy}
+# What a whole table plays: one bot policy in every seat, or a mix
+TABLE_POLICIES = dict(POLICIES, mixed=mixed_policy)
+
+
+# --- SIMULATION ---
+def gini(wealth):
+    x = np.sort(np.maximum(wealth, 0), axis=-1)
+    n = x.shape[-1]
+    total = x.sum(axis=-1)
+    i = np.arange(1, n + 1)
+    return np.divide(((2 * i - n - 1) * x).sum(axis=-1), n * total, out=np.zeros(total.shape), where=total > 0)
+
+
+def run_batch(points, keys, base, replicates, players, years, policy, seeds):
+    # One env plays every point x replicate of the chunk side by side. Each
+    # game draws from its own stream, seeded from its point's seed and its
+    # replicate number, so a point's result doesn't depend on what else runs.
+    n = len(points)
+    scenario = dict(base, **{k: np.repeat(points[:, i], replicates) for i, k in enumerate(keys)})
+    row_seeds = [(s + r) % 2**64 for s in seeds for r in range(replicates)]
+    env = FishTycoonVecEnv(n * replicates, players, years, auto_reset=False, scenario=scenario, row_seeds=row_seeds)
+    capacity = env.params["max_fish_capacity"]
+    min_stock = np.ones(n * replicates)
+    collapse_year = np.full(n * replicates, years)
+    act = TABLE_POLICIES[policy]
+    for year in range(years):
+        env.step(act(env))
+        stock = (env.fish_shore + env.fish_deep) / capacity
+        min_stock = np.minimum(min_stock, stock)
+        collapse_year = np.where((stock < COLLAPSE_THRESHOLD) & (collapse_year == years), year + 1, collapse_year)
+
+    wealth = env.wealth()
+    per_game = np.stack([
+        min_stock < COLLAPSE_THRESHOLD,
+        min_stock,
+        collapse_year,
+        gini(wealth),
+        wealth.mean(axis=1),
+        (env.fish_shore + env.fish_deep) / capacity,
+    ], axis=-1)
+    return per_game.reshape(n, replicates, len(METRICS)).mean(axis=1)
+
+
+# --- CACHE ---
+def _cache_key(point, keys, settings):
+    blob = json.dumps([dict(zip(keys, np.round(point, 12).tolist())), settings], sort_keys=True)
+    return hashlib.sha1(blob.encode()).hexdigest()
+
+
+def _point_seed(cache_key):
+    # Same key (point + settings, incl. --seed) -> same RNG stream
+    return int(cache_key[:16], 16)
+
+
+def run_sweep(points, keys, base=None, replicates=32, players=4, years=20, policy="mixed",
+              workers=None, chunk=64, seed=0, cache_dir=CACHE_DIR):
+    base = base or load_scenario()
+    settings = {"replicates": replicates, "players": players, "years": years, "policy": policy,
+                "seed": seed, "base": base, "rng": "per-row"}
+    results = np.full((len(points), len(METRICS)), np.nan)
+    cache_keys = [_cache_key(pt, keys, settings) for pt in points]
+
+    todo = []
+    for i, key in enumerate(cache_keys):
+        path = os.path.join(cache_dir, key + ".json") if cache_dir else None
+        if path and os.path.exists(path):
+            with open(path) as f:
+                results[i] = json.load(f)
+        else:
+            todo.append(i)
+
+    chunks = [todo[i:i + chunk] for i in range(0, len(todo), chunk)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_batch, points[idx], keys, base, replicates, players, years, policy,
+                               [_point_seed(cache_keys[i]) for i in idx])
+                   for idx in chunks]
+        for idx, fut in zip(chunks, futures):
+            results[idx] = fut.result()
+
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        for i in todo:
+            with open(os.path.join(cache_dir, cache_keys[i] + ".json"), "w") as f:
+                json.dump(results[i].tolist(), f)
+
+    df = pd.DataFrame(points, columns=list(keys))
+    df[list(METRICS)] = results
+    return df
+
+
+# --- ANALYSIS ---
+def sensitivity(df, keys, metrics=("years_to_collapse", "min_stock", "gini")):
+    # Standardized regression coefficients (linear share of variance) next to
+    # Spearman rank correlation (monotone effects); sorted by the first metric.
+    # A metric that never varies has nothing to explain and a key that never
+    # varies explains nothing, so both are left out rather than shown as 0/NaN.
+    keys = [k for k in keys if df[k].nunique() > 1]
+    metrics = [m for m in metrics if df[m].nunique() > 1]
+    if not keys or not metrics:
+        return pd.DataFrame(index=keys)
+    x = df[keys]
+    x = (x - x.mean()) / x.std(ddof=0)
+    report = {}
+    for m in metrics:
+        y = df[m]
+        coef, *_ = np.linalg.lstsq(np.c_[np.ones(len(x)), x.values], (y - y.mean()) / y.std(ddof=0), rcond=None)
+        report[f"{m}_src"] = coef[1:]
+        report[f"{m}_spearman"] = x.rank().corrwith(y.rank()).values
+    out = pd.DataFrame(report, index=keys)
+    return out.reindex(out[f"{metrics[0]}_src"].abs().sort_values(ascending=False).index)
+
+
+def _parse_range(text):
+    key, span = text.split("=")
+    lo, hi = span.split(":")
+    return key, (float(lo), float(hi))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fish Tycoon balance sensitivity sweep")
+    parser.add_argument("--scenario", help="scenario JSON (default: scenario.json / $FISH_SCENARIO)")
+    parser.add_argument("--sampler", choices=SAMPLERS, default="lhs")
+    parser.add_argument("--samples", type=int, default=256)
+    parser.add_argument("--levels", type=int, default=3, help="grid levels per parameter")
+    parser.add_argument("--keys", nargs="+", default=list(SWEEP_KEYS))
+    parser.add_argument("--range", action="append", default=[], type=_parse_range, metavar="KEY=LO:HI")
+    parser.add_argument("--spread", type=float, default=SPREAD)
+    parser.add_argument("--replicates", type=int, default=32)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--policy", choices=TABLE_POLICIES, default="mixed")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--out", help="write every sample and its metrics to CSV")
+    args = parser.parse_args()
+
+    scenario = load_scenario(args.scenario)
+    ranges = default_ranges(scenario, args.keys, args.spread)
+    ranges.update(dict(args.range))
+    keys = tuple(ranges)
+
+    rng = np.random.default_rng(args.seed)
+    unit = SAMPLERS[args.sampler](len(keys), args.samples, rng, levels=args.levels)
+    points = scale(unit, ranges)
+    print(f"Running {len(points)} samples x {args.replicates} replicates ({args.sampler}, {args.policy} bots)...")
+
+    df = run_sweep(points, keys, scenario, args.replicates, args.players, args.years, args.policy,
+                   args.workers, seed=args.seed, cache_dir=None if args.no_cache else args.cache_dir)
+    if args.out:
+        df.to_csv(args.out, index=False)
+
+    print(df[list(METRICS)].describe().loc[["mean", "min", "max"]].round(3).to_string())
+    print("\nWhat drives collapse and inequality:")
+    print(sensitivity(df, keys).round(3).to_string())
+
+
+if __name__ == "__main__":
+    main()
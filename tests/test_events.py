@@ -0,0 +1,49 @@
+import random
+
+import numpy as np
+
+from events import EventModel, build_alias
+
+
+def implied(prob, alias):
+    # Distribution an alias table draws from: column i keeps itself with
+    # prob[i] and hands the rest of its 1/k slice to alias[i].
+    k = len(prob)
+    out = prob / k
+    np.add.at(out, alias, (1 - prob) / k)
+    return out
+
+
+def test_alias_table_reproduces_the_weights():
+    rng = np.random.default_rng(0)
+    for probs in ([1, 1, 1, 1], [40, 12, 12, 12, 12, 12], [0, 0, 5], [1e-9, 1, 3], rng.random(17)):
+        probs = np.asarray(probs, dtype=float)
+        prob, alias = build_alias(probs)
+        assert np.all((prob >= 0) & (prob <= 1 + 1e-12))
+        assert np.allclose(implied(prob, alias), probs / probs.sum())
+
+
+CATALOG = [
+    {"name": n, "description": "", "shore_mod": 1.0, "deep_mod": 1.0, "growth_mod": 0.0,
+     "weight": w, "persistence": p}
+    for n, w, p in (("calm", 6, 0.0), ("storm", 3, 0.5), ("bloom", 1, 0.0))
+]
+
+
+def test_transition_rows_mix_weights_and_persistence():
+    model = EventModel(CATALOG)
+    assert np.allclose(model.transition.sum(axis=1), 1)
+    assert np.allclose(model.transition[1], [0.3, 0.65, 0.05])
+    assert np.allclose(model.transition[-1], [0.6, 0.3, 0.1])
+
+
+def test_batch_and_single_draws_follow_the_transition_rows():
+    model = EventModel(CATALOG)
+    n = 200_000
+    draws = model.sample_batch(np.full(n, 1), np.random.default_rng(1))
+    assert np.allclose(np.bincount(draws, minlength=3) / n, model.transition[1], atol=0.01)
+    draws = model.sample_batch(np.full(n, -1), np.random.default_rng(2))
+    assert np.allclose(np.bincount(draws, minlength=3) / n, model.transition[-1], atol=0.01)
+    rng = random.Random(3)
+    singles = np.bincount([model.sample(1, rng).id for _ in range(50_000)], minlength=3) / 50_000
+    assert np.allclose(singles, model.transition[1], atol=0.015)
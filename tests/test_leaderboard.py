@@ -0,0 +1,36 @@
+import random
+
+from leaderboard import Leaderboard
+
+
+def test_orders_by_score_with_first_seen_ties():
+    board = Leaderboard({"a": 5, "b": 9, "c": 5})
+    assert list(board) == [("b", 9), ("a", 5), ("c", 5)]
+    assert [board.rank(k) for k in "bac"] == [1, 2, 3]
+
+
+def test_update_moves_entry_and_keeps_seat_for_ties():
+    board = Leaderboard({"a": 1, "b": 2, "c": 3})
+    board.update("a", 3)
+    assert list(board) == [("a", 3), ("c", 3), ("b", 2)]
+    board.update("a", 3)   # unchanged score is a no-op
+    assert board.top(2) == [("a", 3), ("c", 3)]
+    assert board.score("a") == 3 and len(board) == 3
+
+
+def test_remove():
+    board = Leaderboard({"a": 1, "b": 2})
+    board.remove("b")
+    assert "b" not in board and list(board) == [("a", 1)]
+
+
+def test_rebuild_matches_single_updates():
+    rng = random.Random(0)
+    scores = {i: rng.randint(0, 20) for i in range(200)}
+    single, bulk = Leaderboard(scores), Leaderboard(scores)
+    new = {i: rng.randint(0, 20) for i in range(0, 250, 2)}
+    for key, score in new.items():
+        single.update(key, score)
+    bulk.rebuild(new)
+    assert list(single) == list(bulk)
+    assert all(single.rank(k) == bulk.rank(k) for k in new)
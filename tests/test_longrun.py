@@ -0,0 +1,16 @@
+import numpy as np
+
+from longrun import LongRun
+
+
+def test_chunked_and_resumed_runs_match_an_unbroken_run(tmp_path):
+    whole = LongRun(8, 4, "greedy", seed=5)
+    whole.run(200)
+    part = LongRun(8, 4, "greedy", seed=5)
+    part.run(100, checkpoint=str(tmp_path / "run.pkl"), every=50)
+    resumed = LongRun.load(str(tmp_path / "run.pkl"))
+    resumed.run(100)
+    for name in ("fish_shore", "fish_deep", "cash", "ships", "event"):
+        assert np.array_equal(getattr(whole.env, name), getattr(resumed.env, name)), name
+    assert whole.summary() == resumed.summary()
+    assert whole.series.frame().equals(resumed.series.frame())
@@ -0,0 +1,62 @@
+from orderbook import ContractBook, settle
+
+
+def test_best_price_fills_first_then_oldest():
+    book = ContractBook()
+    low = book.add_bid(10, 5.0, expires=3)
+    first = book.add_bid(10, 7.0, expires=3)
+    second = book.add_bid(10, 7.0, expires=3)
+    fills = book.match([("a", 25, 0.0)], year=1)
+    assert [(f[0], f[2], f[3]) for f in fills] == [(first, 10, 7.0), (second, 10, 7.0), (low, 5, 5.0)]
+
+
+def test_cheapest_ask_matches_first_and_min_price_is_respected():
+    book = ContractBook()
+    book.add_bid(10, 6.0, expires=3)
+    fills = book.match([("dear", 10, 6.5), ("cheap", 4, 2.0), ("mid", 10, 6.0)], year=1)
+    assert [(f[1], f[2]) for f in fills] == [("cheap", 4), ("mid", 6)]
+
+
+def test_equal_asks_keep_submission_order():
+    book = ContractBook()
+    book.add_bid(5, 6.0, expires=3)
+    fills = book.match([("b", 5, 1.0), ("a", 5, 1.0)], year=1)
+    assert [f[1] for f in fills] == ["b"]
+
+
+def test_partial_fill_leaves_the_rest_resting():
+    book = ContractBook()
+    order = book.add_bid(10, 6.0, expires=3)
+    assert book.match([("a", 4, 0.0)], year=1) == [(order, "a", 4, 6.0)]
+    assert book.best_bids(1, year=1)[0]["qty"] == 6
+    assert book.match([("b", 10, 0.0)], year=1) == [(order, "b", 6, 6.0)]
+    assert book.match([("c", 1, 0.0)], year=1) == []
+
+
+def test_expired_and_cancelled_orders_are_skipped():
+    book = ContractBook()
+    old = book.add_bid(10, 9.0, expires=1)
+    gone = book.add_bid(10, 8.0, expires=5)
+    live = book.add_bid(10, 4.0, expires=5)
+    book.cancel(gone)
+    assert [o["id"] for o in book.best_bids(5, year=2)] == [live]
+    fills = book.match([("a", 10, 0.0)], year=2)
+    assert fills == [(live, "a", 10, 4.0)]
+    assert old not in [f[0] for f in fills]
+
+
+def test_expire_drops_stale_orders():
+    book = ContractBook()
+    book.add_bid(10, 9.0, expires=1)
+    book.add_bid(10, 4.0, expires=3)
+    book.expire(2)
+    assert len(book) == 1
+
+
+def test_settle_delivers_in_fill_order_and_charges_shortfall():
+    fills = [(0, "a", 6, 10.0), (1, "a", 6, 8.0), (2, "b", 3, 10.0)]
+    out = settle(fills, {"a": 8, "b": 5, "c": 2}, penalty_mult=2)
+    assert out["a"] == {"filled": 12, "delivered": 8, "revenue": 6 * 10.0 + 2 * 8.0,
+                        "penalty": 4 * 8.0 * 2, "remaining": 0}
+    assert out["b"] == {"filled": 3, "delivered": 3, "revenue": 30.0, "penalty": 0.0, "remaining": 2}
+    assert out["c"] == {"filled": 0, "delivered": 0, "revenue": 0.0, "penalty": 0.0, "remaining": 2}
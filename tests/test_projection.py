@@ -0,0 +1,33 @@
+import pytest
+
+from events import EVENTS, EVENT_MODEL
+from projection import _project, project, steady_state
+
+
+@pytest.mark.parametrize("event", range(len(EVENTS)))
+@pytest.mark.parametrize("fleet", [(0, 0), (4, 6), (12, 15), (40, 40)])
+def test_steady_state_matches_iterated_projection(event, fleet):
+    (s_stock, s_catch), (d_stock, d_catch) = (steady_state("shore", fleet[0], event),
+                                              steady_state("deep", fleet[1], event))
+    # The steady state is a fixed point of one projected year...
+    _, shore, deep, catch = _project(s_stock, d_stock, fleet[0], fleet[1], event, None, None, 1)[0]
+    assert (shore, deep) == pytest.approx((s_stock, d_stock), rel=1e-9, abs=1e-9)
+    assert catch == pytest.approx(s_catch + d_catch, rel=1e-9, abs=1e-9)
+    # ...and where iterating from a mid-range stock ends up (slowly near
+    # the collapse point, hence the looser tolerance)
+    _, shore, deep, catch = _project(300, 700, fleet[0], fleet[1], event, None, None, 2000)[-1]
+    assert (shore, deep) == pytest.approx((s_stock, d_stock), rel=1e-3, abs=1e-6)
+    assert catch == pytest.approx(s_catch + d_catch, rel=1e-3, abs=1e-6)
+
+
+def test_current_event_is_year_one_and_prev_forecasts_it():
+    for e in range(len(EVENTS)):
+        known = project(300, 700, 5, 5, years=3, current=e)
+        assert known[0] == project(300, 700, 5, 5, years=1, event=e)[0]
+        between = project(300, 700, 5, 5, years=1, prev=e)
+        probs = EVENT_MODEL.forecast(e, 1)[0]
+        pinned = [project(300, 700, 5, 5, years=1, event=k)[0] for k in range(len(EVENTS))]
+        # The expected-weather year lies inside the range of the possible ones
+        assert min(r[3] for r in pinned) - 1e-9 <= between[0][3] <= max(r[3] for r in pinned) + 1e-9
+        if probs.max() < 1:
+            assert known[1:] != project(300, 700, 5, 5, years=2, prev=e)
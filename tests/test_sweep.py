@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+import sweep
+from vecenv import RowStreams
+
+
+def _points(n, keys=("shore_growth", "deep_efficiency")):
+    base = sweep.load_scenario()
+    unit = sweep.lhs_sampler(len(keys), n, np.random.default_rng(1))
+    return sweep.scale(unit, sweep.default_ranges(base, keys)), keys, base
+
+
+def test_point_result_does_not_depend_on_its_batch():
+    points, keys, base = _points(6)
+    seeds = [11, 22, 33, 44, 55, 66]
+    together = sweep.run_batch(points, keys, base, 4, 4, 8, "mixed", seeds)
+    reversed_ = sweep.run_batch(points[::-1], keys, base, 4, 4, 8, "mixed", seeds[::-1])
+    alone = [sweep.run_batch(points[i:i + 1], keys, base, 4, 4, 8, "mixed", seeds[i:i + 1])[0] for i in range(6)]
+    np.testing.assert_array_equal(together, reversed_[::-1])
+    np.testing.assert_array_equal(together, np.array(alone))
+
+
+def test_row_streams_are_independent_of_other_rows():
+    a, b = RowStreams([1, 2, 3]), RowStreams([2])
+    np.testing.assert_array_equal(a.random((3, 5))[1], b.random((1, 5))[0])
+    # Drawing for a subset advances only those rows
+    a[np.array([False, True, False])].uniform(0, 1, (1, 2))
+    b.uniform(0, 1, (1, 2))
+    np.testing.assert_array_equal(a.integers(0, 10, (3, 4))[1], b.integers(0, 10, (1, 4))[0])
+
+
+def test_sensitivity_skips_constant_keys_and_metrics():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"a": rng.random(50), "fixed": 1.0})
+    df["years_to_collapse"] = 3 * df["a"] + rng.normal(0, 0.1, 50)
+    df["min_stock"] = 0.0
+    df["gini"] = -df["a"]
+    out = sweep.sensitivity(df, ["a", "fixed"])
+    assert list(out.index) == ["a"]
+    assert list(out.columns) == ["years_to_collapse_src", "years_to_collapse_spearman", "gini_src", "gini_spearman"]
+    assert not out.isna().any().any()
@@ -0,0 +1,67 @@
+import asyncio
+import socket
+import threading
+
+import pytest
+
+from netplay import receive, send
+from tournament import HUMAN, Entrant, Tournament
+
+
+def test_bracket_with_short_tables_terminates():
+    # 6 entrants at tables of 4 with 3 going through: two tables of 3, each
+    # must still drop its last place or the field never shrinks
+    entrants = [Entrant(f"Bot {i}", rating=1500 + i, policy="greedy") for i in range(6)]
+    t = Tournament(entrants, table_size=4, years=3, workers=1)
+    final = t.run_bracket(advance=3)
+    assert t.round == 2
+    assert len(final) == 4
+    assert sum(e.alive for e in entrants) == 4
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _human(name, port, log):
+    # Scripted person: fishes the whole fleet on the shore, sells everything
+    async def play():
+        for _ in range(100):
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                break
+            except OSError:
+                await asyncio.sleep(0.05)
+        await send(writer, {"type": "join", "name": name})
+        while True:
+            msg = await receive(reader)
+            log.append(msg["type"])
+            if msg["type"] == "ask":
+                reply = {"shore": msg["private"]["ships"]} if msg["phase"] == "action" else {}
+                await send(writer, dict(reply, type="decision", phase=msg["phase"], seq=msg["seq"]))
+            elif msg["type"] in ("gameover", "error"):
+                break
+        writer.close()
+    asyncio.run(play())
+
+
+def test_human_table_results_flow_into_standings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    port = _free_port()
+    entrants = [Entrant("Ann", policy=HUMAN)] + [Entrant(f"Bot {i}", policy="greedy") for i in range(4)]
+    t = Tournament(entrants, table_size=3, years=2, workers=1, host="127.0.0.1", port=port)
+    log = []
+    client = threading.Thread(target=_human, args=("Ann", port, log))
+    client.start()
+    standings = t.run_swiss(1)
+    client.join(timeout=10)
+
+    assert log[-1] == "gameover" and log.count("ask") >= 4
+    ann = standings.set_index("name").loc["Ann"]
+    assert ann["policy"] == HUMAN and ann["games"] == 1
+    rows = [h for h in t.history if h["name"] == "Ann"]
+    assert len(rows) == 1 and rows[0]["wealth"] > 0
+    assert sorted(h["place"] for h in t.history if h["table"] == rows[0]["table"]) == [1, 2, 3]
+    assert (tmp_path / "archives" / f"tournament-r1-t{rows[0]['table']}.fta").exists()
@@ -0,0 +1,44 @@
+import numpy as np
+
+from scenario import MAX_FISH_CAPACITY, SHIP_SCRAP, SHIP_PRICE_MAX
+from valuation import contract_value, mark_to_market, ship_price
+
+
+def test_ship_price_runs_from_scrap_to_max_with_density_squared():
+    assert ship_price(0) == SHIP_SCRAP
+    assert ship_price(MAX_FISH_CAPACITY) == SHIP_PRICE_MAX
+    half = ship_price(MAX_FISH_CAPACITY / 2)
+    assert np.isclose(half, round(SHIP_SCRAP + (SHIP_PRICE_MAX - SHIP_SCRAP) / 4, 2))
+
+
+def test_contract_value_is_floored_at_the_default_penalty():
+    assert contract_value(10, 8.0, 5.0) == 30.0                    # above market: asset
+    assert contract_value(10, 8.0, 9.0, penalty_mult=2) == -10.0   # cheaper to deliver
+    assert contract_value(10, 2.0, 9.0, penalty_mult=2) == -40.0   # cheaper to default
+
+
+def test_mark_to_market_components():
+    out = mark_to_market(1000, 3, 1000, fish_price=10, freezer=20, pending=1,
+                         contract_qty=5, contract_price=12, discount=0.5, penalty_mult=2, breakdown=True)
+    price = ship_price(1000)
+    assert np.isclose(out["fleet"], 4 * price)
+    assert np.isclose(out["freezer"], 20 * 10 * 0.5)
+    assert np.isclose(out["contracts"], 5 * 2)
+    assert np.isclose(out["total"], 1000 + 4 * price + 100 + 10)
+
+
+def test_batch_matches_per_player_calls():
+    rng = np.random.default_rng(0)
+    B, P = 7, 4
+    cash = rng.uniform(0, 3000, (B, P))
+    ships = rng.integers(0, 10, (B, P))
+    freezer = rng.integers(0, 50, (B, P))
+    stock = rng.uniform(0, MAX_FISH_CAPACITY, B)
+    price = rng.uniform(1, 15, B)
+    discount = rng.uniform(0.2, 0.8, B)
+    batch = mark_to_market(cash, ships, stock, price, freezer, discount=discount)
+    assert batch.shape == (B, P)
+    for b in range(B):
+        for p in range(P):
+            one = mark_to_market(cash[b, p], ships[b, p], stock[b], price[b], freezer[b, p], discount=discount[b])
+            assert np.isclose(batch[b, p], one[0])
@@ -0,0 +1,42 @@
+import random
+
+import numpy as np
+import pytest
+
+from events import EVENTS
+from local4p import Ocean, Player, ZonedOcean
+from zones import ZoneOcean
+
+
+def test_one_by_two_grid_without_migration_plays_like_the_classic_ocean():
+    rng = random.Random(3)
+    classic, zoned = Ocean(), ZonedOcean(1, 2, migration=0.0)
+    players = {o: [Player(n) for n in "ABC"] for o in (classic, zoned)}
+    for year in range(15):
+        event = EVENTS[rng.randrange(len(EVENTS))]
+        split = [(rng.randint(0, 6), rng.randint(0, 6)) for _ in "ABC"]
+        results = []
+        for ocean in (classic, zoned):
+            ocean.current_event = event
+            for p, (s, d) in zip(players[ocean], split):
+                p.ships = s + d
+                p.set_allocation(s, d, np.array([[s, d]]))
+            catches, total = ocean.calculate_catch(players[ocean])
+            ocean.reproduce_fish()
+            results.append(([(c['shore'], c['deep']) for c in catches.values()], total,
+                            ocean.fish_shore, ocean.fish_deep))
+        assert results[1][0] == pytest.approx(results[0][0], rel=1e-12)
+        assert results[1][1:] == pytest.approx(results[0][1:], rel=1e-12)
+
+
+def test_migration_conserves_the_total_stock():
+    rng = np.random.default_rng(0)
+    ocean = ZoneOcean.from_scenario(4, 5, shore_cols=2, migration=0.25, rng=rng, jitter=0.3)
+    ocean.stock = ocean.capacity * rng.random(ocean.capacity.shape)
+    total = ocean.total_fish
+    for _ in range(50):
+        ocean.migrate()
+        assert ocean.total_fish == pytest.approx(total, rel=1e-12)
+    # ...while evening out the density between zones
+    density = ocean.stock / ocean.capacity
+    assert density.std() < 0.05
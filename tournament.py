@@ -0,0 +1,290 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from vecenv import FishTycoonVecEnv, EVENT_NAMES
+from sweep import POLICIES
+from netplay import GameServer, DEFAULT_PORT
+
+HOUSE_BOT = "greedy"   # policy for seats no entrant fills
+HUMAN = "human"        # entrant "policy" for a person playing over netplay
+ELO_K = 32
+
+# Entrants are policies from sweep.POLICIES or humans. Bot-only tables are
+# played headless on the vectorized env; a table with a human is hosted as a
+# netplay game (one GameServer per table, consecutive ports) where the humans
+# join under their entrant names and every other seat is a policy bot. Both
+# kinds of table report final wealth per seat, so placings, points and Elo
+# are worked out the same way.
+
+
+# --- ENTRANTS ---
+class Entrant:
+    def __init__(self, name, rating=1500, policy=HOUSE_BOT):
+        if policy != HUMAN and policy not in POLICIES:
+            raise ValueError(f"{name}: unknown policy '{policy}'")
+        self.name = name
+        self.rating = float(rating)
+        self.policy = policy
+        self.points = 0
+        self.games = 0
+        self.wins = 0
+        self.total_wealth = 0.0
+        self.alive = True
+
+
+# --- TABLE RESOLUTION (runs in worker processes) ---
+def mixed_actions(env, seat_policies):
+    # Every policy in play computes actions for the whole batch; each seat
+    # then keeps the actions of its own policy.
+    actions = {}
+    for name in np.unique(seat_policies):
+        mask = seat_policies == name
+        for key, value in POLICIES[name](env).items():
+            value = np.broadcast_to(np.asarray(value, dtype=float), mask.shape)
+            actions[key] = np.where(mask, value, actions.get(key, 0.0))
+    return actions
+
+
+def run_tables(seat_policies, years, seed):
+    seat_policies = np.asarray(seat_policies)
+    env = FishTycoonVecEnv(len(seat_policies), seat_policies.shape[1], years, seed=seed, auto_reset=False)
+    for _ in range(years):
+        env.step(mixed_actions(env, seat_policies))
+    return env.wealth()
+
+
+# --- HUMAN TABLES ---
+class PolicyBot:
+    # Answers netplay asks with a sweep policy: the ask is loaded into a
+    # one-game env and the policy's action for that game is sent back. Like
+    # in the headless game, policy bots neither list nor bid at auction.
+    def __init__(self, policy, years, seed):
+        self.act = POLICIES[policy]
+        self.env = FishTycoonVecEnv(1, 1, years, seed=seed, auto_reset=False)
+        self.freeze = 0
+
+    def __call__(self, msg):
+        if msg["phase"] == "freeze":
+            return {"freeze": min(self.freeze, msg["available"])}
+        if msg["phase"] != "action":
+            return {}
+        env, pub, me = self.env, msg["public"], msg["private"]
+        env.fish_shore[:], env.fish_deep[:] = pub["shore"], pub["deep"]
+        env.market_price[:], env.event[:] = pub["fish_price"], EVENT_NAMES.index(pub["event"])
+        env.contract_qty[:], env.contract_price[:] = pub["contract_qty"], pub["contract_price"]
+        env.year[:] = pub["year"]
+        env.cash[:], env.ships[:], env.pending_ships[:] = me["cash"], me["ships"], me["pending"]
+        env.freezer[:], env.last_catch[:] = me["freezer"], me["last_catch"]
+        actions = {k: np.broadcast_to(v, (1, 1))[0, 0] for k, v in self.act(env).items()}
+        self.freeze = int(actions.get("freeze", 0))
+        return {"accept": bool(actions.get("accept_contract", False)), "order": int(actions.get("order", 0)),
+                "shore": int(actions.get("shore", 0)), "deep": int(actions.get("deep", 0))}
+
+
+def table_server(table, years, seed, turn_timeout=None, archive_path=None):
+    # Humans keep their seat open until they join; all other seats are bots
+    names = [e.name if e else f"House {seat + 1}" for seat, e in enumerate(table)]
+    server = GameServer(len(table), years, turn_timeout, seed, seating=names,
+                        archive_path=archive_path or os.path.join("archives", "tournament.fta"))
+    for seat, e in enumerate(table):
+        if e is None or e.policy != HUMAN:
+            server.add_bot(names[seat], PolicyBot(e.policy if e else HOUSE_BOT, years, seed * 100 + seat))
+    return server
+
+
+def run_human_tables(servers, host, port):
+    async def serve_all():
+        await asyncio.gather(*(s.serve(host, port + i) for i, s in enumerate(servers)))
+    asyncio.run(serve_all())
+    return np.array([s.final_wealth for s in servers])
+
+
+# --- SEATING ---
+def snake_seat(entrants, table_size):
+    # Spread ratings evenly: 1st..Nth seed go to tables 1..N, then N..1, ...
+    n_tables = max(1, math.ceil(len(entrants) / table_size))
+    tables = [[] for _ in range(n_tables)]
+    for i, e in enumerate(sorted(entrants, key=lambda e: -e.rating)):
+        lap, pos = divmod(i, n_tables)
+        tables[pos if lap % 2 == 0 else n_tables - 1 - pos].append(e)
+    return [t + [None] * (table_size - len(t)) for t in tables]
+
+
+def group_seat(entrants, table_size):
+    # Swiss: players on similar scores meet (entrants already in standings order)
+    tables = [entrants[i:i + table_size] for i in range(0, len(entrants), table_size)]
+    return [t + [None] * (table_size - len(t)) for t in tables]
+
+
+# --- TOURNAMENT ---
+class Tournament:
+    def __init__(self, entrants, table_size=4, years=10, workers=None, seed=0,
+                 host="0.0.0.0", port=DEFAULT_PORT, turn_timeout=None):
+        self.entrants = list(entrants)
+        self.table_size = table_size
+        self.years = years
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.host, self.port, self.turn_timeout = host, port, turn_timeout
+        self.round = 0
+        self.history = []
+
+    def play_round(self, tables):
+        self.round += 1
+        wealth = np.zeros((len(tables), self.table_size))
+        live = [t for t, table in enumerate(tables) if any(e and e.policy == HUMAN for e in table)]
+        headless = [t for t in range(len(tables)) if t not in live]
+
+        if headless:
+            seat_policies = [[e.policy if e else HOUSE_BOT for e in tables[t]] for t in headless]
+            n_chunks = min(self.workers, len(headless))
+            bounds = np.linspace(0, len(headless), n_chunks + 1).astype(int)
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = [
+                    pool.submit(run_tables, seat_policies[lo:hi], self.years, self.seed * 1000 + self.round * 100 + c)
+                    for c, (lo, hi) in enumerate(zip(bounds[:-1], bounds[1:])) if hi > lo
+                ]
+                wealth[headless] = np.concatenate([f.result() for f in futures])
+
+        if live:
+            servers = []
+            for i, t in enumerate(live):
+                humans = ", ".join(e.name for e in tables[t] if e and e.policy == HUMAN)
+                print(f"Round {self.round}, table {t + 1}: {humans} join on port {self.port + i}")
+                servers.append(table_server(tables[t], self.years, self.seed * 1000 + self.round * 100 + t,
+                                            self.turn_timeout,
+                                            os.path.join("archives", f"tournament-r{self.round}-t{t + 1}.fta")))
+            wealth[live] = run_human_tables(servers, self.host, self.port)
+
+        results = []
+        for t, (table, table_wealth) in enumerate(zip(tables, wealth)):
+            order = np.argsort(-table_wealth, kind="stable")
+            place = np.empty(len(order), dtype=int)
+            place[order] = np.arange(len(order))
+            for seat, e in enumerate(table):
+                if e is None:
+                    continue
+                e.games += 1
+                e.points += self.table_size - 1 - place[seat]
+                e.wins += place[seat] == 0
+                e.total_wealth += table_wealth[seat]
+                results.append({"round": self.round, "table": t + 1, "seat": seat + 1, "name": e.name,
+                                "place": place[seat] + 1, "wealth": round(float(table_wealth[seat]), 2)})
+            self._update_ratings(table, place)
+        self.history.extend(results)
+        return results
+
+    def _update_ratings(self, table, place):
+        # Multiplayer Elo: every pair at the table is one game, K split over opponents
+        seated = [(e, place[i]) for i, e in enumerate(table) if e is not None]
+        if len(seated) < 2:
+            return
+        k = ELO_K / (len(seated) - 1)
+        deltas = [0.0] * len(seated)
+        for i, (a, pa) in enumerate(seated):
+            for b, pb in seated:
+                if a is b:
+                    continue
+                expected = 1 / (1 + 10 ** ((b.rating - a.rating) / 400))
+                score = 1.0 if pa < pb else 0.5 if pa == pb else 0.0
+                deltas[i] += k * (score - expected)
+        for (e, _), d in zip(seated, deltas):
+            e.rating += d
+
+    def standings(self):
+        rows = [{
+            "name": e.name, "policy": e.policy, "rating": round(e.rating), "points": e.points,
+            "games": e.games, "wins": e.wins,
+            "avg_wealth": round(e.total_wealth / e.games, 2) if e.games else 0.0,
+            "alive": e.alive,
+        } for e in self.entrants]
+        df = pd.DataFrame(rows).sort_values(["points", "avg_wealth"], ascending=False, kind="stable")
+        return df.reset_index(drop=True)
+
+    def run_swiss(self, rounds):
+        for r in range(rounds):
+            order = self.entrants if r == 0 else sorted(
+                self.entrants, key=lambda e: (-e.points, -e.total_wealth / max(1, e.games)))
+            tables = snake_seat(order, self.table_size) if r == 0 else group_seat(order, self.table_size)
+            self.play_round(tables)
+        return self.standings()
+
+    def run_bracket(self, advance=1):
+        # Knockout: the top `advance` of every table go through until one
+        # table remains; that final decides the champion. A short table
+        # always drops at least its last place, so the field keeps shrinking.
+        if not 0 < advance < self.table_size:
+            raise ValueError("advance must be between 1 and table_size - 1")
+        field = list(self.entrants)
+        while True:
+            tables = snake_seat(field, self.table_size)
+            results = self.play_round(tables)
+            if len(tables) == 1:
+                return sorted(results, key=lambda h: h["place"])
+            through = set()
+            for t in range(1, len(tables) + 1):
+                seated = sorted((h for h in results if h["table"] == t), key=lambda h: h["place"])
+                through.update(h["name"] for h in seated[:min(advance, max(1, len(seated) - 1))])
+            if len(through) >= len(field):
+                raise ValueError(f"bracket cannot shrink a field of {len(field)} at tables of {self.table_size}")
+            for e in field:
+                e.alive = e.name in through
+            field = [e for e in field if e.alive]
+
+
+def load_entrants(path):
+    with open(path) as f:
+        return [Entrant(**e) for e in json.load(f)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fish Tycoon tournament scheduler (policy bots and netplay humans)")
+    parser.add_argument("--entrants", help=f"JSON list of {{name, rating, policy}}; policy '{HUMAN}' seats a person")
+    parser.add_argument("--human", action="append", default=[], metavar="NAME",
+                        help="add a human entrant (joins with: netplay.py join NAME --port ...)")
+    parser.add_argument("--bots", type=int, default=64, help="number of generated entrants if no file")
+    parser.add_argument("--format", choices=("swiss", "bracket"), default="swiss")
+    parser.add_argument("--rounds", type=int, default=5, help="Swiss rounds")
+    parser.add_argument("--advance", type=int, default=1, help="players per table going through (bracket)")
+    parser.add_argument("--table-size", type=int, default=4)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--host", default="0.0.0.0", help="where human tables listen")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="first port for human tables")
+    parser.add_argument("--turn-timeout", type=float, default=None, help="seconds before a silent human passes")
+    parser.add_argument("--out", help="write every table result to CSV")
+    args = parser.parse_args()
+
+    if args.entrants:
+        entrants = load_entrants(args.entrants)
+    else:
+        rng = np.random.default_rng(args.seed)
+        names = list(POLICIES)
+        entrants = [Entrant(f"Bot {i+1}", rating=rng.normal(1500, 100), policy=names[i % len(names)])
+                    for i in range(args.bots)]
+    entrants += [Entrant(name, policy=HUMAN) for name in args.human]
+
+    t = Tournament(entrants, args.table_size, args.years, args.workers, args.seed,
+                   args.host, args.port, args.turn_timeout)
+    if args.format == "swiss":
+        print(t.run_swiss(args.rounds).head(20).to_string())
+    else:
+        final = t.run_bracket(args.advance)
+        print(f"Final table (round {t.round}):")
+        for h in final:
+            print(f"  {h['place']}. {h['name']}  ${h['wealth']:,.0f}")
+        print(f"\nChampion: {final[0]['name']}")
+    if args.out:
+        pd.DataFrame(t.history).to_csv(args.out, index=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import time
+
+import numpy as np
+
+from scenario import (
+    MAX_FISH_CAPACITY, SHIP_SCRAP, SHIP_PRICE_MAX, FREEZER_DISCOUNT, CONTRACT_PENALTY_MULT,
+)
+
+
+# --- MARK-TO-MARKET ---
+# Wealth as if every position were closed at today's prices:
+#   ships + pending orders   density-squared resale price (Ocean.get_ship_market_price)
+#   freezer                  fish price x freezer_discount (it sells next season, at risk)
+#   open contract            qty x (contract price - fish price), but never worse than
+#                            defaulting and paying the shortfall penalty
+# Per-game inputs (stock, prices, scenario knobs) are scalars or (...,)
+# arrays, per-player inputs are (..., P): one call values a hot-seat table,
+# the web lobby or every player of B vecenv games with a handful of array ops.
+def ship_price(stock, capacity=MAX_FISH_CAPACITY, scrap=SHIP_SCRAP, top=SHIP_PRICE_MAX):
+    density = np.asarray(stock, dtype=float) / capacity
+    return np.round(scrap + (top - scrap) * density ** 2, 2)
+
+
+def contract_value(qty, price, fish_price, penalty_mult=CONTRACT_PENALTY_MULT):
+    price = np.asarray(price, dtype=float)
+    return np.asarray(qty, dtype=float) * np.maximum(price - fish_price, -price * penalty_mult)
+
+
+def _per_game(x):
+    return np.asarray(x, dtype=float)[..., None]
+
+
+def mark_to_market(cash, ships, stock, fish_price, freezer=0, pending=0, contract_qty=0, contract_price=0,
+                   capacity=MAX_FISH_CAPACITY, scrap=SHIP_SCRAP, top=SHIP_PRICE_MAX,
+                   discount=FREEZER_DISCOUNT, penalty_mult=CONTRACT_PENALTY_MULT, breakdown=False):
+    fish_price = _per_game(fish_price)
+    fleet = (np.asarray(ships, dtype=float) + pending) * _per_game(ship_price(stock, capacity, scrap, top))
+    stored = np.asarray(freezer, dtype=float) * fish_price * _per_game(discount)
+    contracts = contract_value(contract_qty, _per_game(contract_price), fish_price, _per_game(penalty_mult))
+    total = cash + fleet + stored + contracts
+    if breakdown:
+        parts = {"cash": cash, "fleet": fleet, "freezer": stored, "contracts": contracts, "total": total}
+        return {k: np.broadcast_to(v, total.shape) for k, v in parts.items()}
+    return total
+
+
+def main():
+    # Throughput check: value 100k games x 4 players per call
+    rng = np.random.default_rng(0)
+    B, P = 100_000, 4
+    args = (rng.uniform(0, 5000, (B, P)), rng.integers(0, 20, (B, P)), rng.uniform(0, MAX_FISH_CAPACITY, B),
+            rng.uniform(1, 15, B), rng.integers(0, 200, (B, P)))
+    start = time.perf_counter()
+    for _ in range(10):
+        mark_to_market(*args)
+    per_call = (time.perf_counter() - start) / 10
+    print(f"{B * P:,} players valued in {per_call * 1000:.1f} ms ({per_call / (B * P) * 1e9:.1f} ns / player)")
+
+
+if __name__ == "__main__":
+    main()
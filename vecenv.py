@@ -0,0 +1,298 @@
+import numpy as np
+
+from scenario import SCENARIO
+from events import EVENT_MODEL
+from valuation import ship_price, mark_to_market
+
+EVENT_NAMES = EVENT_MODEL.names
+EVENT_SHORE_MOD = EVENT_MODEL.shore_mod
+EVENT_DEEP_MOD = EVENT_MODEL.deep_mod
+EVENT_GROWTH_MOD = EVENT_MODEL.growth_mod
+
+OBS_FEATURES = (
+    "fish_shore", "fish_deep", "market_price", "ship_price",
+    "shore_mod", "deep_mod", "growth_mod",
+    "contract_qty", "contract_price", "years_left",
+    "cash", "ships", "pending_ships", "freezer", "last_catch", "last_profit",
+)
+
+
+# --- PER-ROW RANDOM STREAMS ---
+# A counter-based generator with one stream per env row: draw n of row i is
+# splitmix64(key_i + n * GOLDEN). What a row draws depends only on its own
+# seed and how much it has drawn so far, never on which other rows share the
+# batch, and a draw across many rows is still one array operation. Covers
+# the Generator calls the env, events and bots make; the leading axis of
+# every draw indexes rows.
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _splitmix64(z):
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+class RowStreams:
+    def __init__(self, seeds):
+        self.key = _splitmix64(np.asarray(seeds, dtype=np.uint64))
+        self.drawn = np.zeros(len(self.key), dtype=np.uint64)
+        self.rows = np.arange(len(self.key))
+
+    def __getitem__(self, rows):
+        # A view on some rows; their counters advance in the parent too
+        view = object.__new__(RowStreams)
+        view.key, view.drawn, view.rows = self.key, self.drawn, self.rows[rows]
+        return view
+
+    def random(self, size):
+        size = tuple(np.atleast_1d(size))
+        if size[0] != len(self.rows):
+            raise ValueError(f"draw for {size[0]} rows from {len(self.rows)} streams")
+        per_row = int(np.prod(size[1:], dtype=np.int64))
+        n = self.drawn[self.rows, None] + np.arange(1, per_row + 1, dtype=np.uint64)
+        self.drawn[self.rows] += np.uint64(per_row)
+        z = _splitmix64(self.key[self.rows, None] + n * _GOLDEN)
+        return ((z >> np.uint64(11)) * 2.0**-53).reshape(size)
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        if size is None:
+            size = np.broadcast_shapes(np.shape(low), np.shape(high))
+        return low + (np.asarray(high) - low) * self.random(size)
+
+    def integers(self, low, high=None, size=None):
+        if high is None:
+            low, high = 0, low
+        return np.floor(self.uniform(low, high, size)).astype(np.int64)
+
+
+# --- VECTORIZED GAME ---
+# B independent games of P players each, stepped one year at a time. Every
+# rule is an array operation over the (B,) / (B, P) state, so a step costs the
+# same number of Python statements whether B is 1 or 100,000.
+#
+# step() takes a dict of action arrays (missing keys default to "do nothing"):
+#   list_qty (B,P)   ships put up for auction      list_min (B,P)  reserve price
+#   bids (B,P,P)     bids[b,i,j] = i's bid on j's lot
+#   accept_contract (B,P)   order (B,P)   shore (B,P)   deep (B,P)   freeze (B,P)
+# Invalid values are clipped to what the hot-seat game would have allowed.
+#
+# `scenario` overrides scenario.json; each numeric entry may be a scalar or a
+# (B,) array, so one env can play a whole batch of parameter settings.
+# `row_seeds` (one per env) gives every game its own RowStreams stream
+# instead of one generator shared by the batch.
+class FishTycoonVecEnv:
+    def __init__(self, num_envs, num_players, max_years=20, seed=None, auto_reset=True, scenario=None,
+                 row_seeds=None):
+        self.num_envs = num_envs
+        self.num_players = num_players
+        self.max_years = max_years
+        self.auto_reset = auto_reset
+        if row_seeds is not None and len(row_seeds) != num_envs:
+            raise ValueError(f"{len(row_seeds)} row seeds for {num_envs} envs")
+        self.rng = np.random.default_rng(seed) if row_seeds is None else RowStreams(row_seeds)
+        self.params = {}
+        for key, value in dict(SCENARIO, **(scenario or {})).items():
+            if isinstance(SCENARIO.get(key), (int, float)):
+                self.params[key] = np.broadcast_to(np.asarray(value, dtype=float), (num_envs,)).copy()
+        self.reset()
+
+    # --- state ---
+    def reset(self, mask=None):
+        B, P = self.num_envs, self.num_players
+        if mask is None:
+            mask = np.ones(B, dtype=bool)
+            self.fish_shore = np.empty(B)
+            self.fish_deep = np.empty(B)
+            self.market_price = np.empty(B)
+            self.event = np.full(B, -1, dtype=np.int64)
+            self.year = np.zeros(B, dtype=np.int64)
+            self.contract_qty = np.zeros(B)
+            self.contract_price = np.zeros(B)
+            self.cash = np.empty((B, P))
+            self.ships = np.empty((B, P), dtype=np.int64)
+            self.pending_ships = np.empty((B, P), dtype=np.int64)
+            self.freezer = np.empty((B, P))
+            self.last_catch = np.empty((B, P))
+            self.last_profit = np.empty((B, P))
+
+        p = self.params
+        self.fish_shore[mask] = (p["max_fish_capacity"] * p["shore_share"] * p["initial_stock"])[mask]
+        self.fish_deep[mask] = (p["max_fish_capacity"] * (1 - p["shore_share"]) * p["initial_stock"])[mask]
+        self.market_price[mask] = p["base_fish_price"][mask]
+        self.year[mask] = 1
+        self.cash[mask] = p["starting_cash"][mask, None]
+        self.ships[mask] = p["starting_ships"][mask, None].astype(np.int64)
+        self.pending_ships[mask] = 0
+        self.event[mask] = -1
+        self.freezer[mask] = 0.0
+        self.last_catch[mask] = 0.0
+        self.last_profit[mask] = 0.0
+        self._start_year(mask)
+        return self.observe()
+
+    def _start_year(self, mask):
+        rng = self.rng[mask] if isinstance(self.rng, RowStreams) else self.rng
+        self.event[mask] = EVENT_MODEL.sample_batch(self.event[mask], rng)
+        base_qty = self.ships[mask].mean(axis=1) * 18
+        qty = np.floor(rng.uniform(base_qty * 0.7, base_qty * 1.1))
+        self.contract_qty[mask] = np.maximum(30, qty)
+        self.contract_price[mask] = np.round(self.market_price[mask] * self.params["contract_price_mult"][mask], 2)
+
+    def ship_price(self):
+        p = self.params
+        return ship_price(self.fish_shore + self.fish_deep, p["max_fish_capacity"], p["ship_scrap"], p["ship_price_max"])
+
+    def wealth(self, breakdown=False):
+        # Mark-to-market, see valuation.py. Between steps there are no
+        # pending orders or open contracts, so this is cash + fleet + freezer.
+        p = self.params
+        return mark_to_market(self.cash, self.ships, self.fish_shore + self.fish_deep, self.market_price,
+                              self.freezer, self.pending_ships, capacity=p["max_fish_capacity"],
+                              scrap=p["ship_scrap"], top=p["ship_price_max"], discount=p["freezer_discount"],
+                              breakdown=breakdown)
+
+    def observe(self):
+        B, P = self.num_envs, self.num_players
+        public = np.stack([
+            self.fish_shore, self.fish_deep, self.market_price, self.ship_price(),
+            EVENT_SHORE_MOD[self.event], EVENT_DEEP_MOD[self.event], EVENT_GROWTH_MOD[self.event],
+            self.contract_qty, self.contract_price, self.max_years - self.year + 1,
+        ], axis=-1)
+        private = np.stack([
+            self.cash, self.ships, self.pending_ships, self.freezer, self.last_catch, self.last_profit,
+        ], axis=-1)
+        obs = np.empty((B, P, len(OBS_FEATURES)), dtype=np.float32)
+        obs[:, :, :public.shape[1]] = public[:, None, :]
+        obs[:, :, public.shape[1]:] = private
+        return obs
+
+    # --- rules ---
+    def _auction(self, list_qty, list_min, bids):
+        P = self.num_players
+        qty = np.clip(list_qty, 0, self.ships)
+        bids = np.clip(bids, 0, np.maximum(0, np.floor(self.cash))[:, :, None])
+        valid = (bids >= list_min[:, None, :]) & (bids > 0) & (qty[:, None, :] > 0)
+        valid &= ~np.eye(P, dtype=bool)[None]
+        masked = np.where(valid, bids, -1.0)
+        winner = masked.argmax(axis=1)                       # (B, P) per lot
+        price = np.take_along_axis(masked, winner[:, None, :], axis=1)[:, 0, :]
+        sold = price >= 0
+        price = np.where(sold, price, 0.0)
+        moved = np.where(sold, qty, 0)
+
+        self.ships -= moved
+        self.cash += price
+        rows = np.broadcast_to(np.arange(self.num_envs)[:, None], winner.shape)
+        np.add.at(self.ships, (rows, winner), moved)
+        np.add.at(self.cash, (rows, winner), -price)
+
+    def _catch(self, shore, deep):
+        p = self.params
+        total_s = shore.sum(axis=1)
+        total_d = deep.sum(axis=1)
+        eff_s = p["shore_efficiency"] * EVENT_SHORE_MOD[self.event]
+        eff_d = p["deep_efficiency"] * EVENT_DEEP_MOD[self.event]
+        pen_s = 1.0 / (1 + np.maximum(0, total_s - p["crowding_knee"]) * p["crowding_slope"])
+        pen_d = 1.0 / (1 + np.maximum(0, total_d - p["crowding_knee"]) * p["crowding_slope"])
+        pot_s = np.minimum(self.fish_shore, self.fish_shore * eff_s * total_s * pen_s)
+        pot_d = np.minimum(self.fish_deep, self.fish_deep * eff_d * total_d * pen_d)
+
+        share_s = np.divide(shore, total_s[:, None], out=np.zeros(shore.shape), where=total_s[:, None] > 0)
+        share_d = np.divide(deep, total_d[:, None], out=np.zeros(deep.shape), where=total_d[:, None] > 0)
+        catch = share_s * pot_s[:, None] + share_d * pot_d[:, None]
+
+        self.fish_shore = np.maximum(0, self.fish_shore - pot_s)
+        self.fish_deep = np.maximum(0, self.fish_deep - pot_d)
+        return catch, pot_s + pot_d
+
+    def _price(self, total_mass):
+        p = self.params
+        m = np.maximum(1, total_mass)
+        price = p["base_fish_price"] * np.exp(p["price_elasticity"] * (p["baseline_demand"] - m))
+        return np.clip(np.round(price, 2), p["price_floor"], p["price_ceiling"])
+
+    def _reproduce(self):
+        p = self.params
+        g = EVENT_GROWTH_MOD[self.event]
+        cap_s = p["max_fish_capacity"] * p["shore_share"]
+        cap_d = p["max_fish_capacity"] * (1 - p["shore_share"])
+        r_s = p["shore_growth"] + g
+        r_d = p["deep_growth"] + g
+        self.fish_shore = np.maximum(0, self.fish_shore + r_s * self.fish_shore * (1 - self.fish_shore / cap_s))
+        self.fish_deep = np.maximum(0, self.fish_deep + r_d * self.fish_deep * (1 - self.fish_deep / cap_d))
+
+    def step(self, actions):
+        B, P = self.num_envs, self.num_players
+        p = {k: v[:, None] for k, v in self.params.items()}
+        zeros = np.zeros((B, P))
+        act = lambda key: np.broadcast_to(np.asarray(actions.get(key, zeros)), (B, P))
+        wealth_before = self.wealth()
+
+        # 3. Auction
+        if "list_qty" in actions:
+            bids = np.broadcast_to(np.asarray(actions.get("bids", np.zeros((B, P, P)))), (B, P, P))
+            self._auction(act("list_qty").astype(np.int64), act("list_min"), bids)
+
+        # 4. Action phase: contract, shipyard, fleet allocation
+        accepted = act("accept_contract").astype(bool)
+        order = np.clip(act("order").astype(np.int64), 0, np.maximum(0, self.cash // p["ship_cost"]).astype(np.int64))
+        self.cash -= order * p["ship_cost"]
+        self.pending_ships += order
+        shore = np.clip(act("shore").astype(np.int64), 0, self.ships)
+        deep = np.clip(act("deep").astype(np.int64), 0, self.ships - shore)
+        harbor = self.ships - shore - deep
+
+        # 5. Simulation
+        catch, total_mass = self._catch(shore, deep)
+        self.market_price = self._price(total_mass)
+        self.last_catch = catch
+
+        # 6-7. Sales, storage and accounting
+        available = np.floor(catch + self.freezer)
+        to_freeze = np.clip(np.floor(act("freeze")), 0, available)
+        to_sell = available - to_freeze
+        storage_bill = to_freeze * p["storage_cost"]
+        self.freezer = to_freeze
+
+        cq = self.contract_qty[:, None]
+        cp = self.contract_price[:, None]
+        delivered = np.where(accepted, np.minimum(cq, to_sell), 0)
+        penalty = np.where(accepted, (cq - delivered) * cp * p["contract_penalty_mult"], 0)
+        revenue = delivered * cp + (to_sell - delivered) * self.market_price[:, None]
+        op_costs = harbor * p["harbor_cost"] + shore * p["shore_cost"] + deep * p["deep_cost"]
+
+        self.cash += revenue - op_costs - storage_bill - penalty
+        self.last_profit = revenue - (op_costs + storage_bill)
+        self.ships += self.pending_ships
+        self.pending_ships[:] = 0
+
+        # 8. Growth
+        self._reproduce()
+
+        reward = self.wealth() - wealth_before
+        done = self.year >= self.max_years
+        info = {"catch": catch, "total_mass": total_mass, "event": self.event.copy()}
+        if done.any():
+            info["final_wealth"] = np.where(done[:, None], self.wealth(), np.nan)
+
+        self.year += 1
+        running = ~done
+        if running.any():
+            self._start_year(running)
+        if self.auto_reset and done.any():
+            self.reset(done)
+        return self.observe(), reward, done, info
+
+    # --- helpers ---
+    def random_actions(self):
+        B, P = self.num_envs, self.num_players
+        shore = self.rng.integers(0, self.ships + 1)
+        deep = self.rng.integers(0, self.ships - shore + 1)
+        return {
+            "accept_contract": self.rng.random((B, P)) < 0.5,
+            "order": self.rng.integers(0, 2, (B, P)),
+            "shore": shore,
+            "deep": deep,
+            "freeze": self.rng.random((B, P)) * self.freezer,
+        }
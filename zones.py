@@ -0,0 +1,140 @@
+import argparse
+import time
+
+import numpy as np
+
+from scenario import SCENARIO
+
+SHORE, DEEP = 0, 1
+
+
+# --- MULTI-ZONE OCEAN ---
+# Optional replacement for the two scalar grounds: a rows x cols grid of
+# fishing zones, each with its own capacity, growth rate, efficiency and
+# crowding knee. The first `shore_cols` columns hug the coast and take the
+# shore event modifier; the rest are deep water. Fleets allocate ships per
+# zone as an (F, rows, cols) array and the whole year is array arithmetic,
+# so 100 zones x 1,000 fleets resolves in milliseconds.
+#
+# A 1 x 2 grid with migration 0 is exactly the classic shore/deep ocean.
+# local4p plays on it with --zones RxC (see local4p.ZonedOcean).
+class ZoneOcean:
+    def __init__(self, capacity, growth, efficiency, kind, knee, slope, migration=0.0, initial=0.4):
+        self.capacity = np.asarray(capacity, dtype=float)
+        shape = self.capacity.shape
+        self.growth = np.broadcast_to(np.asarray(growth, dtype=float), shape)
+        self.efficiency = np.broadcast_to(np.asarray(efficiency, dtype=float), shape)
+        self.kind = np.broadcast_to(np.asarray(kind), shape)
+        self.knee = np.broadcast_to(np.asarray(knee, dtype=float), shape)
+        self.slope = np.broadcast_to(np.asarray(slope, dtype=float), shape)
+        if not 0 <= migration <= 0.25:
+            raise ValueError("migration rate must be in [0, 0.25] for a stable diffusion step")
+        self.migration = migration
+        self.stock = self.capacity * initial
+
+    @classmethod
+    def from_scenario(cls, rows, cols, scenario=SCENARIO, shore_cols=1, migration=None, rng=None, jitter=0.0):
+        # Splits the scenario's shore/deep capacity evenly over the zones of
+        # each kind; `jitter` adds +/- random variation per zone.
+        kind = np.full((rows, cols), DEEP)
+        kind[:, :shore_cols] = SHORE
+        is_shore = kind == SHORE
+        n_shore = is_shore.sum()
+        n_deep = kind.size - n_shore
+        cap_total = scenario["max_fish_capacity"]
+        capacity = np.where(is_shore,
+                            cap_total * scenario["shore_share"] / max(1, n_shore),
+                            cap_total * (1 - scenario["shore_share"]) / max(1, n_deep))
+        if jitter:
+            rng = rng or np.random.default_rng()
+            capacity = capacity * rng.uniform(1 - jitter, 1 + jitter, capacity.shape)
+        return cls(
+            capacity,
+            growth=np.where(is_shore, scenario["shore_growth"], scenario["deep_growth"]),
+            efficiency=np.where(is_shore, scenario["shore_efficiency"], scenario["deep_efficiency"]),
+            kind=kind,
+            knee=scenario["crowding_knee"],
+            slope=scenario["crowding_slope"],
+            migration=scenario.get("migration_rate", 0.0) if migration is None else migration,
+            initial=scenario["initial_stock"],
+        )
+
+    @property
+    def total_fish(self):
+        return self.stock.sum()
+
+    def event_mod(self, event):
+        return np.where(self.kind == SHORE, event.shore_mod, event.deep_mod)
+
+    def calculate_catch(self, allocation, event):
+        # allocation: (F, rows, cols) ships per fleet per zone.
+        # Returns (F,) catch per fleet, (F, rows, cols) catch per zone, total.
+        allocation = np.asarray(allocation, dtype=float)
+        ships = allocation.sum(axis=0)
+        eff = self.efficiency * self.event_mod(event)
+        penalty = 1.0 / (1 + np.maximum(0, ships - self.knee) * self.slope)
+        potential = np.minimum(self.stock, self.stock * eff * ships * penalty)
+        share = np.divide(allocation, ships, out=np.zeros_like(allocation), where=ships > 0)
+        per_zone = share * potential
+        self.stock = np.maximum(0, self.stock - potential)
+        return per_zone.sum(axis=(1, 2)), per_zone, potential.sum()
+
+    def migrate(self):
+        # Fish swim down the density gradient (stock / capacity) to the four
+        # neighbours; edges are closed, so the total is conserved.
+        if self.migration == 0:
+            return
+        density = self.stock / self.capacity
+        flow_x = self.migration * (density[:, :-1] - density[:, 1:]) * np.minimum(self.capacity[:, :-1], self.capacity[:, 1:])
+        flow_y = self.migration * (density[:-1, :] - density[1:, :]) * np.minimum(self.capacity[:-1, :], self.capacity[1:, :])
+        stock = self.stock.copy()
+        stock[:, :-1] -= flow_x
+        stock[:, 1:] += flow_x
+        stock[:-1, :] -= flow_y
+        stock[1:, :] += flow_y
+        self.stock = np.maximum(0, stock)
+
+    def reproduce_fish(self, event):
+        r = self.growth + event.growth_mod
+        self.stock = np.maximum(0, self.stock + r * self.stock * (1 - self.stock / self.capacity))
+
+    def run_year(self, allocation, event):
+        catches, per_zone, total_mass = self.calculate_catch(allocation, event)
+        self.reproduce_fish(event)
+        self.migrate()
+        return catches, per_zone, total_mass
+
+
+def main():
+    # Quick benchmark: random fleets on a rows x cols map
+    from events import EVENT_MODEL
+
+    parser = argparse.ArgumentParser(description="Multi-zone ocean benchmark")
+    parser.add_argument("--rows", type=int, default=10)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--players", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=50)
+    parser.add_argument("--ships", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    scenario = dict(SCENARIO, max_fish_capacity=SCENARIO["max_fish_capacity"] * args.rows * args.cols / 2)
+    ocean = ZoneOcean.from_scenario(args.rows, args.cols, scenario, shore_cols=max(1, args.cols // 5), rng=rng, jitter=0.2)
+    n_zones = args.rows * args.cols
+
+    start = time.perf_counter()
+    prev = None
+    for year in range(1, args.years + 1):
+        event = EVENT_MODEL.sample(prev)
+        prev = event.id
+        zone = rng.integers(0, n_zones, size=(args.players, args.ships))
+        allocation = np.zeros((args.players, n_zones))
+        np.add.at(allocation, (np.arange(args.players)[:, None], zone), 1)
+        ocean.run_year(allocation.reshape(args.players, args.rows, args.cols), event)
+    elapsed = time.perf_counter() - start
+    print(f"{n_zones} zones x {args.players} fleets: {elapsed / args.years * 1000:.2f} ms/year, "
+          f"final stock {int(ocean.total_fish)} / {int(ocean.capacity.sum())}")
+
+
+if __name__ == "__main__":
+    main()